@@ -1,4 +1,8 @@
 from manim import *
+from lib.misc.point_buffers import FamilySnapshot
+from bisect import bisect_left
+from itertools import accumulate
+import time
 
 
 class ComposeAnimations(Animation):
@@ -9,15 +13,26 @@ class ComposeAnimations(Animation):
         # of duration 1. If this is true, then animation will be 1 + 0.5
         # duration, effectively overriding run_time
         run_time_match_weights=False,
+        # Normally every frame resets to the starting state and replays every
+        # finished directive at alpha 1 before the active one runs. If this is
+        # true, the state is captured once when each directive ends and the
+        # active directive resumes from that checkpoint instead. Only safe
+        # when directives don't depend on anything changing mid-animation.
+        skip_finished_directives=False,
         **kwargs,
     ):
         self.run_time_match_weights = run_time_match_weights
+        self.skip_finished_directives = skip_finished_directives
         # List of weights and interpolations of animations from 0 to 1
         # If weight is 0, animation will "instantly" play
         # If weight is negative, animation will simply not be added
+        # Directives are always called on the state the previous directive
+        # ended in (or the starting state, for the first one).
         self.directives: list[
             tuple[float, Callable[[Animation, float], None]]
         ] = []
+        # Mobject state at the start of each directive reached so far
+        self.checkpoints: list[FamilySnapshot] = []
         super().__init__(*args, **kwargs)
         self._build()
 
@@ -35,33 +50,87 @@ class ComposeAnimations(Animation):
         self.unnormalized_weights = [
             directive[0] for directive in self.directives
         ]
-        total_weights = sum(directive[0] for directive in self.directives)
+        total_weights = sum(self.unnormalized_weights)
         self.normalized_weights = [
             weight / total_weights for weight in self.unnormalized_weights
         ]
-        self.partial_weights = [
-            sum(self.normalized_weights[:i])
-            for i in range(len(self.normalized_weights))
-        ]
+        # Where each directive starts on the [0, 1] timeline
+        self.partial_weights = (
+            list(accumulate(self.normalized_weights[:-1], initial=0))
+            if self.directives
+            else []
+        )
         if self.run_time_match_weights:
             self.set_run_time(sum(self.unnormalized_weights))
 
+    def _active_directive(self, alpha: float) -> int:
+        # The first directive that hasn't ended strictly before alpha
+        return bisect_left(self.partial_weights, alpha, 1) - 1
+
+    def _resume_from_checkpoint(self, index: int):
+        # Fill in the checkpoints of any directives the timeline jumped past
+        while len(self.checkpoints) <= index:
+            i = len(self.checkpoints) - 1
+            self.checkpoints[i].restore()
+            self.directives[i][1](self, 1)
+            self.checkpoints.append(FamilySnapshot(self.mobject))
+        self.checkpoints[index].restore()
+
+    def begin(self):
+        self.checkpoints = [FamilySnapshot(self.mobject)]
+        super().begin()
+
     def interpolate_mobject(self, alpha: float):
-        for i in range(len(self.partial_weights)):
-            if (
-                i < len(self.partial_weights) - 1
-                and alpha > self.partial_weights[i + 1]
-            ):
+        if not self.directives:
+            return
+
+        index = self._active_directive(alpha)
+        if self.skip_finished_directives:
+            self._resume_from_checkpoint(index)
+        else:
+            self.checkpoints[0].restore()
+            for i in range(index):
                 self.directives[i][1](self, 1)
-            else:
-                directive_rt = min(
-                    (
-                        (alpha - self.partial_weights[i])
-                        / self.normalized_weights[i]
-                        if self.normalized_weights[i] > 0
-                        else 1
-                    ),
-                    1,
-                )
-                self.directives[i][1](self, directive_rt)
-                break
+
+        weight = self.normalized_weights[index]
+        directive_alpha = min(
+            (
+                (alpha - self.partial_weights[index]) / weight
+                if weight > 0
+                else 1
+            ),
+            1,
+        )
+        self.directives[index][1](self, directive_alpha)
+
+
+class ComposeAnimationsBenchmark(Scene):
+    # Average time per frame when replaying finished directives versus resuming
+    # from checkpoints, as the number of directives grows.
+    def time_per_frame(self, directive_count, skip_finished_directives):
+        anim = ComposeAnimations(
+            Dot(), skip_finished_directives=skip_finished_directives
+        ).add_directives(
+            *[
+                (1, lambda anim, alpha: anim.mobject.shift(RIGHT * alpha))
+                for _ in range(directive_count)
+            ]
+        )
+        frames = config.frame_rate * 2
+        anim.begin()
+        start = time.perf_counter()
+        for frame in range(frames + 1):
+            anim.interpolate(frame / frames)
+        elapsed = time.perf_counter() - start
+        anim.finish()
+        return elapsed / (frames + 1)
+
+    def construct(self):
+        for directive_count in [2, 8, 32, 128]:
+            replay = self.time_per_frame(directive_count, False)
+            resume = self.time_per_frame(directive_count, True)
+            logger.info(
+                f"{directive_count} directives: "
+                f"replay {replay * 1e6:.1f}us/frame, "
+                f"checkpoint {resume * 1e6:.1f}us/frame"
+            )
@@ -0,0 +1,83 @@
+from manim import *
+from fractions import Fraction
+from weakref import WeakKeyDictionary, WeakSet
+import re
+
+# \frac{a}{b}, \dfrac{a}{b} or \tfrac{a}{b} with integer a and b
+_FRAC_TEX = re.compile(r"\\[dt]?frac\{\s*(-?\d+)\s*\}\{\s*(-?\d+)\s*\}")
+
+# The registries indexing each bucket by its own label. Kept out of the
+# bucket so copies of it don't drag their registries along.
+_registries_of = WeakKeyDictionary()
+
+
+def fraction_key(item) -> Fraction:
+    # The reduced fraction an item stands for, so a/b and c/d get the same
+    # key exactly when ad = bc. Takes numbers, strings like "\frac{a}{b}",
+    # "a/b" or "0.5", and Tex mobjects through their tex_string.
+    if isinstance(item, Mobject):
+        if not hasattr(item, "tex_string"):
+            raise ValueError(f"{item} has no tex_string to read a value from")
+        item = item.tex_string
+    if isinstance(item, str):
+        text = item.strip()
+        match = _FRAC_TEX.fullmatch(text)
+        if match is not None:
+            return Fraction(int(match[1]), int(match[2]))
+        return Fraction(text)
+    return Fraction(item)
+
+
+class EquivalenceRegistry:
+    # Buckets indexed by the key of their label, so finding the bucket an item
+    # belongs in is a single dict lookup, however many buckets there are.
+    def __init__(self, key: Callable = fraction_key):
+        self.key = key
+        self.buckets: dict = {}
+        # Key of each bucket indexed by its own label, which follows relabels
+        self.label_keys: dict = {}
+
+    def register(self, bucket, label=None):
+        # Indexes the bucket under its own label unless given another one
+        if label is not None:
+            self.buckets[self.key(label)] = bucket
+            return bucket
+        if bucket.label_text is None:
+            raise ValueError("Can't register a bucket without a label")
+        self._unindex(bucket)
+        key = self.key(bucket.label_text)
+        self.buckets[key] = bucket
+        self.label_keys[bucket] = key
+        _registries_of.setdefault(bucket, WeakSet()).add(self)
+        return bucket
+
+    def _unindex(self, bucket):
+        key = self.label_keys.pop(bucket, None)
+        if key is not None and self.buckets.get(key) is bucket:
+            del self.buckets[key]
+
+    def bucket_for(self, item):
+        return self.buckets.get(self.key(item))
+
+    def __contains__(self, item):
+        # Whether some registered bucket takes this item
+        return self.key(item) in self.buckets
+
+    def insert(self, item):
+        bucket = self.bucket_for(item)
+        if bucket is None:
+            raise ValueError(f"No bucket registered for {item}")
+        bucket.put_in(item)
+        return bucket
+
+    def insert_all(self, items):
+        return [self.insert(item) for item in items]
+
+
+def relabeled(bucket):
+    # Moves a bucket to its new label in every registry indexing it by label
+    for registry in list(_registries_of.get(bucket, ())):
+        if bucket.label_text is None:
+            registry._unindex(bucket)
+        else:
+            registry.register(bucket)
@@ -0,0 +1,129 @@
+from manim import *
+import time
+
+# TeX for every token a GlyphLabel can show. "N=" is compiled as one token so
+# it keeps the spacing TeX puts around the relation.
+_GLYPH_TEX = {
+    **{digit: digit for digit in "0123456789"},
+    ".": ".",
+    "-": "-",
+    "+": "+",
+    "e": "e",
+    "N=": "N=",
+    "ε": r"\varepsilon",
+    "=": "=",
+    "×": r"\times",
+    "÷": r"\div",
+    "Error": r"\text{Error}",
+}
+# Longest first, so "N=" wins over any shorter token it starts with
+_TOKENS = sorted(_GLYPH_TEX, key=len, reverse=True)
+
+_atlases: dict[float, "_GlyphAtlas"] = {}
+
+
+class _GlyphAtlas:
+    # Every token compiled once, in a single MathTex, at one font size. Glyphs
+    # are stored with their bottom left corner at the origin.
+    def __init__(self, font_size: float):
+        tokens = list(_GLYPH_TEX)
+        tex = MathTex(
+            *[_GLYPH_TEX[token] for token in tokens], font_size=font_size
+        )
+        parts = dict(zip(tokens, tex))
+        baseline = parts["0"].get_bottom()[1]
+
+        self.glyphs: dict[str, VMobject] = {}
+        # Height of the bottom of each glyph above the baseline
+        self.raises: dict[str, float] = {}
+        self.widths: dict[str, float] = {}
+        for token, part in parts.items():
+            self.raises[token] = part.get_bottom()[1] - baseline
+            self.widths[token] = part.width
+            self.glyphs[token] = part.copy().shift(-part.get_corner(DL))
+        # Gap between neighbouring glyphs, as TeX set it between the digits
+        self.spacing = parts["1"].get_left()[0] - parts["0"].get_right()[0]
+
+
+def _get_atlas(font_size: float) -> _GlyphAtlas:
+    if font_size not in _atlases:
+        _atlases[font_size] = _GlyphAtlas(font_size)
+    return _atlases[font_size]
+
+
+def _tokenize(text: str) -> list[str]:
+    tokens = []
+    i = 0
+    while i < len(text):
+        token = next((t for t in _TOKENS if text.startswith(t, i)), None)
+        if token is None:
+            raise ValueError(f"GlyphLabel can't show {text[i]!r} in {text!r}")
+        tokens.append(token)
+        i += len(token)
+    return tokens
+
+
+class GlyphLabel(VGroup):
+    # A short numeric label put together from copies of glyphs compiled once
+    # per font size, so changing its text doesn't go through LaTeX. Meant for
+    # labels that change every frame.
+    def __init__(
+        self,
+        text: str = "",
+        font_size: float = DEFAULT_FONT_SIZE,
+        text_color=WHITE,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.font_size = font_size
+        self.text_color = text_color
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text: str):
+        if text == self.text:
+            return self
+
+        atlas = _get_atlas(self.font_size)
+        center = self.get_center() if self.submobjects else ORIGIN
+        glyphs = []
+        x = 0
+        for token in _tokenize(text):
+            glyph = atlas.glyphs[token].copy()
+            glyph.shift(RIGHT * x + UP * atlas.raises[token])
+            glyphs.append(glyph)
+            x += atlas.widths[token] + atlas.spacing
+
+        self.remove(*self.submobjects)
+        self.add(*glyphs)
+        self.set_color(self.text_color)
+        if glyphs:
+            self.move_to(center)
+        self.text = text
+        return self
+
+
+class GlyphLabelBenchmark(Scene):
+    # Frames per second of a label tracking an animating epsilon, rebuilt as a
+    # MathTex each frame versus updated as a GlyphLabel.
+    def construct(self):
+        frames = config.frame_rate * 2
+        values = [
+            f"{0.1 * 0.01 ** (frame / frames):.4}" for frame in range(frames)
+        ]
+
+        tex_label = MathTex(values[0], font_size=32)
+        start = time.perf_counter()
+        for value in values:
+            tex_label.become(MathTex(value, font_size=32))
+        tex_fps = frames / (time.perf_counter() - start)
+
+        glyph_label = GlyphLabel(values[0], font_size=32)
+        start = time.perf_counter()
+        for value in values:
+            glyph_label.set_text(value)
+        glyph_fps = frames / (time.perf_counter() - start)
+
+        logger.info(
+            f"MathTex: {tex_fps:.1f} fps, GlyphLabel: {glyph_fps:.1f} fps"
+        )
@@ -0,0 +1,132 @@
+from manim import *
+import time
+import tracemalloc
+
+# Per-mobject arrays that become() would otherwise rebuild. Opacities live in
+# the alpha column of the rgba arrays.
+_ARRAY_ATTRS = (
+    "points",
+    "fill_rgbas",
+    "stroke_rgbas",
+    "background_stroke_rgbas",
+    "rgbas",
+)
+# Plain attributes only; VMobject.color is a property that recolors the family
+_SCALAR_ATTRS = ("stroke_width", "background_stroke_width")
+
+
+class FamilySnapshot:
+    # Point, color and opacity state of a mobject family, held in preallocated
+    # arrays. restore() writes it back in place with np.copyto, so resetting a
+    # mobject every frame doesn't allocate or rebuild any submobjects.
+    def __init__(self, mobject: Mobject):
+        self.mobject = mobject
+        self.family = mobject.get_family()
+        self.arrays = [
+            (member, attr, np.array(getattr(member, attr)))
+            for member in self.family
+            for attr in _ARRAY_ATTRS
+            if hasattr(member, attr)
+        ]
+        self.scalars = []
+        self.capture()
+
+    def capture(self):
+        for i, (member, attr, buffer) in enumerate(self.arrays):
+            current = getattr(member, attr)
+            if current.shape == buffer.shape:
+                np.copyto(buffer, current)
+            else:
+                self.arrays[i] = (member, attr, np.array(current))
+        self.scalars = [
+            (member, attr, getattr(member, attr))
+            for member in self.family
+            for attr in _SCALAR_ATTRS
+            if hasattr(member, attr)
+        ]
+        return self
+
+    def restore(self):
+        for member, attr, buffer in self.arrays:
+            current = getattr(member, attr)
+            # Something like a Transform may have swapped in an array with a
+            # different number of points since the capture
+            if current.shape == buffer.shape:
+                np.copyto(current, buffer)
+            else:
+                setattr(member, attr, buffer.copy())
+        for member, attr, value in self.scalars:
+            setattr(member, attr, value)
+        return self.mobject
+
+
+class StackedPoints:
+    # The points of several mobject families stacked into one (N, 3) array,
+    # with each member's points rebound as a view into it. Writing to points
+    # moves every mobject in a single NumPy operation. item_index gives the
+    # mobject each row belongs to.
+    def __init__(self, mobjects: list[Mobject]):
+        self.mobjects = list(mobjects)
+        self.members = []
+        counts = []
+        items = []
+        for i, mobject in enumerate(self.mobjects):
+            for member in mobject.get_family():
+                if len(member.points):
+                    self.members.append(member)
+                    counts.append(len(member.points))
+                    items.append(i)
+        self.counts = counts
+        self.points = (
+            np.concatenate([member.points for member in self.members])
+            if self.members
+            else np.zeros((0, 3))
+        )
+        self.item_index = np.repeat(np.array(items, dtype=int), counts)
+        self.bind()
+
+    def bind(self):
+        start = 0
+        for member, count in zip(self.members, self.counts):
+            member.points = self.points[start : start + count]
+            start += count
+        return self
+
+    def release(self):
+        # Gives every member its own copy of its points again
+        for member in self.members:
+            member.points = member.points.copy()
+        return self
+
+
+class FamilySnapshotBenchmark(Scene):
+    # Bytes allocated per frame resetting a mobject with become() versus
+    # restoring a FamilySnapshot.
+    def allocated_per_frame(self, reset, frames=60):
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        for _ in range(frames):
+            reset()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return (peak - baseline) / frames, elapsed / frames
+
+    def construct(self):
+        mobject = VGroup(
+            *[RegularPolygon(6).set_fill(BLUE, 0.5) for _ in range(50)]
+        ).arrange_in_grid()
+        starting_mobject = mobject.copy()
+        snapshot = FamilySnapshot(mobject)
+
+        for name, reset in [
+            ("become", lambda: mobject.become(starting_mobject)),
+            ("FamilySnapshot.restore", snapshot.restore),
+        ]:
+            allocated, elapsed = self.allocated_per_frame(reset)
+            logger.info(
+                f"{name}: {allocated:.0f} bytes/frame, "
+                f"{elapsed * 1e6:.1f}us/frame"
+            )
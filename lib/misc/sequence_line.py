@@ -1,22 +1,42 @@
 from manim import *
+from lib.misc.glyph_label import GlyphLabel
+from collections.abc import Mapping
 from typing import Optional, Literal
-import math
 
 
 def _scaler(dist_to_converges_value_in_line):
-    return abs(
-        1
-        / ((math.log10(min(max(dist_to_converges_value_in_line, 0.1), 9)) - 1))
+    # Works elementwise on arrays of distances too
+    return np.abs(
+        1 / (np.log10(np.clip(dist_to_converges_value_in_line, 0.1, 9)) - 1)
     )
 
 
 _DOT_SCALE_FACTOR = 0.25
 EPSILON_CORRECTION = 10e-10
+# Number of terms evaluated at a time
+_CHUNK_SIZE = 4096
+# Number of terms sampled to estimate the bounds of the sequence
+_BOUNDS_SAMPLES = 64
+# Number of sequence texts compiled together when one of them is first needed
+_TEXT_BATCH_SIZE = 4
+
+
+# Where the anchors and handles of a straight Line sit between its ends
+_LINE_ALPHAS = np.linspace(0, 1, 4)[:, np.newaxis]
+_LINE_ALPHAS_COMPLEMENT = 1 - _LINE_ALPHAS
+
+
+def _set_line_points(line: Line, start, end):
+    if line.points.shape != (4, 3):
+        line.points = np.empty((4, 3))
+    np.multiply(_LINE_ALPHAS_COMPLEMENT, start, out=line.points)
+    line.points += _LINE_ALPHAS * end
 
 
 class _Interval(Line):
     def __init__(self, length=0.25, color=WHITE, *args, **kwargs):
         super().__init__(*args, color=color, **kwargs)
+        self.tick_length = length
         l1 = Line(start=np.zeros((3)), end=RIGHT * length, color=color).rotate(
             PI / 2
         )
@@ -24,12 +44,237 @@ class _Interval(Line):
         l1.align_to(self, LEFT)
         l2.align_to(self, RIGHT)
         self.add(l1, l2)
+        self.left_tick = l1
+        self.right_tick = l2
+
+    def set_endpoints(self, start, end):
+        # Rewrites the existing points rather than building new lines
+        _set_line_points(self, start, end)
+        left, right = (start, end) if start[0] <= end[0] else (end, start)
+        half_tick = UP * self.tick_length / 2
+        _set_line_points(self.left_tick, left - half_tick, left + half_tick)
+        _set_line_points(self.right_tick, right - half_tick, right + half_tick)
+        return self
+
+
+class _SequenceValues(Mapping):
+    # Sequence terms keyed by index, evaluated a chunk at a time the first time
+    # any term in the chunk is needed. Terms not evaluated yet are NaN.
+    def __init__(
+        self,
+        sequence: Optional[Callable[[int], float]],
+        vectorized_sequence: Optional[Callable[[np.ndarray], np.ndarray]],
+        count: int,
+    ):
+        self.sequence = sequence
+        self.vectorized_sequence = vectorized_sequence
+        self.count = count
+        self.values = np.full(count, np.nan)
+        self.evaluated = np.zeros(-(-count // _CHUNK_SIZE), dtype=bool)
+        # Bumped whenever more terms get evaluated
+        self.version = 0
+
+    def evaluate(self, indices) -> np.ndarray:
+        # Terms at the given indices, without storing them
+        indices = np.asarray(indices, dtype=np.int64)
+        if self.vectorized_sequence is not None:
+            return np.asarray(self.vectorized_sequence(indices), dtype=float)
+        return np.array([float(self.sequence(int(i))) for i in indices])
+
+    def _evaluate_chunk(self, chunk: int):
+        if self.evaluated[chunk]:
+            return
+        start = chunk * _CHUNK_SIZE
+        stop = min(start + _CHUNK_SIZE, self.count)
+        self.values[start:stop] = self.evaluate(np.arange(start, stop) + 1)
+        self.evaluated[chunk] = True
+        self.version += 1
+
+    def prefix(self, count: int) -> np.ndarray:
+        for chunk in range(-(-count // _CHUNK_SIZE)):
+            self._evaluate_chunk(chunk)
+        return self.values[:count]
+
+    def evaluate_all(self) -> np.ndarray:
+        return self.prefix(self.count)
+
+    def __getitem__(self, i: int):
+        if not 1 <= i <= self.count:
+            raise KeyError(i)
+        self._evaluate_chunk((i - 1) // _CHUNK_SIZE)
+        return self.values[i - 1]
+
+    def __iter__(self):
+        return iter(range(1, self.count + 1))
+
+    def __len__(self):
+        return self.count
+
+
+class _DotField:
+    # Position, size and epsilon color of every sequence dot, computed for all
+    # of them in one vectorized pass whenever value_scaling or epsilon changes.
+    # Dots are added to scenes one by one, so each still carries update_dot as
+    # an updater (which is also what keeps cairo redrawing them), but that
+    # only reads the dot's entry out of the shared arrays.
+    def __init__(self, sequence_line: "SequenceLine"):
+        self.sequence_line = sequence_line
+        # Shared with sequence_values, so terms show up here once evaluated
+        self.values = sequence_line.sequence_values.values
+        dot = Dot()
+        # Dot of height 1 centered at the origin, which every dot is a scaled
+        # and shifted copy of
+        self.unit_points = (dot.points - dot.get_center()) / dot.height
+        # Whether each dot is currently colored as inside epsilon
+        self.green = np.zeros(len(self.values), dtype=bool)
+        self.key = None
+        # value_scaling the level of detail groups were last computed for
+        self.groups_key = None
+        self.representatives = np.zeros(0, dtype=np.int64)
+        self.lod_pool: list[Dot] = []
+        self.refresh()
+
+    def refresh(self):
+        line = self.sequence_line
+        key = (
+            line.value_scaling.get_value(),
+            line.epsilon.get_value(),
+            line.sequence_values.version,
+        )
+        if key == self.key:
+            return
+        self.key = key
+        value_scaling, epsilon, _ = key
+
+        dist_to_converges_in_line = (
+            line.converge_value - self.values
+        ) * value_scaling
+        low, high = line.number_line_range
+        start, end = line.number_line.n2p(low), line.number_line.n2p(high)
+        self.centers = start + np.outer(
+            (line.converge_value - dist_to_converges_in_line - low)
+            / (high - low),
+            end - start,
+        )
+        self.heights = (
+            _scaler(np.abs(dist_to_converges_in_line)) * _DOT_SCALE_FACTOR
+        )
+        self.inside = (
+            np.abs(line.converge_value - self.values) + EPSILON_CORRECTION
+            <= epsilon
+        )
+
+    def top(self, i: int):
+        self.refresh()
+        return self.centers[i - 1] + UP * self.heights[i - 1] / 2
+
+    def _place(self, dot, i: int):
+        if dot.points.shape != self.unit_points.shape:
+            dot.points = np.empty_like(self.unit_points)
+        np.multiply(self.unit_points, self.heights[i], out=dot.points)
+        dot.points += self.centers[i]
+
+    def update_dot(self, dot):
+        self.refresh()
+        i = dot.seq_num - 1
+        self._place(dot, i)
+
+        # Dots outside epsilon go back to blue, and ones inside only turn green
+        # once epsilon_changes_color is on
+        green = self.inside[i] and (
+            self.sequence_line.epsilon_changes_color or self.green[i]
+        )
+        if green != self.green[i]:
+            dot.set_color(GREEN if green else BLUE)
+            self.green[i] = green
+
+    def _regroup(self):
+        # Split the visible part of the line into bins lod_pixel_radius pixels
+        # wide and keep the earliest term in each bin as its representative
+        bin_width = (
+            self.sequence_line.lod_pixel_radius
+            * config.frame_width
+            / config.pixel_width
+        )
+        xs = self.centers[:, 0]
+        visible = np.flatnonzero(
+            np.abs(xs) <= config.frame_x_radius + bin_width
+        )
+        if len(visible) == 0:
+            self.representatives = visible
+            return
+        bins = np.floor(
+            (xs[visible] + config.frame_x_radius + bin_width) / bin_width
+        ).astype(np.int64)
+        first = np.full(bins.max() + 1, len(self.values), dtype=np.int64)
+        np.minimum.at(first, bins, visible)
+        self.representatives = first[first < len(self.values)]
+
+    def update_lod_dots(self, group):
+        self.refresh()
+        if self.groups_key != self.key[0]:
+            self._regroup()
+            self.groups_key = self.key[0]
+
+        count = len(self.representatives)
+        while len(self.lod_pool) < count:
+            self.lod_pool.append(Dot(color=BLUE).set(lod_green=False))
+        if len(group.submobjects) != count:
+            group.remove(*group.submobjects)
+            group.add(*self.lod_pool[:count])
+
+        changes_color = self.sequence_line.epsilon_changes_color
+        for dot, i in zip(group.submobjects, self.representatives):
+            self._place(dot, i)
+            green = changes_color and self.inside[i]
+            if green != dot.lod_green:
+                dot.set_color(GREEN if green else BLUE)
+                dot.lod_green = green
+
+
+class _LazyMapping(Mapping):
+    # Mobjects keyed by index from 1 to count, only built the first time
+    # they're looked up. build_batch builds several at once, and a lookup
+    # builds the next batch_size missing ones along with the one asked for.
+    def __init__(
+        self,
+        build_batch: Callable[[list[int]], list[Mobject]],
+        count: int,
+        batch_size: int = 1,
+    ):
+        self.build_batch = build_batch
+        self.count = count
+        self.batch_size = batch_size
+        self.built: dict[int, Mobject] = {}
+
+    def prefetch(self, indices):
+        missing = [
+            i
+            for i in dict.fromkeys(indices)
+            if i not in self.built and 1 <= i <= self.count
+        ]
+        if missing:
+            self.built.update(zip(missing, self.build_batch(missing)))
+
+    def __getitem__(self, i: int) -> Mobject:
+        if i not in self.built:
+            if not 1 <= i <= self.count:
+                raise KeyError(i)
+            self.prefetch(range(i, min(i + self.batch_size, self.count + 1)))
+        return self.built[i]
+
+    def __iter__(self):
+        return iter(range(1, self.count + 1))
+
+    def __len__(self):
+        return self.count
 
 
 class SequenceLine(Mobject):
     def __init__(
         self,
-        sequence: Callable[[int], float],
+        # May be None if vectorized_sequence is given
+        sequence: Optional[Callable[[int], float]],
         converge_value: float,
         # 1/2 will get flattened into float 0.5. We may still want 1 and 2 for
         # display though.
@@ -44,6 +289,18 @@ class SequenceLine(Mobject):
         interval_direction: Literal["below", "above", "both"] = "both",
         # Whether to show x_n = in the sequence text
         show_xn_text=True,
+        # If set, lod_dots shows one representative dot for every group of
+        # dots this many pixels apart, regrouped as value_scaling changes. Use
+        # it instead of sequence_dots when samples is huge.
+        lod_pixel_radius: Optional[float] = None,
+        # Takes an array of indices and returns the terms at them. Used instead
+        # of sequence when given, which avoids a Python call per term.
+        vectorized_sequence: Optional[
+            Callable[[np.ndarray], np.ndarray]
+        ] = None,
+        # Lowest and highest terms, if known. Otherwise they're estimated from
+        # a sample of terms.
+        bounds: Optional[tuple[float, float]] = None,
         **kwargs,
     ):
         self.sequence = sequence
@@ -55,6 +312,9 @@ class SequenceLine(Mobject):
         self.padding_scale = padding_scale
         self.interval_direction = interval_direction
         self.show_xn_text = show_xn_text
+        self.lod_pixel_radius = lod_pixel_radius
+        self.vectorized_sequence = vectorized_sequence
+        self.bounds = bounds
 
         self.value_scaling = ValueTracker(1)
         self.epsilon = ValueTracker(1)
@@ -69,85 +329,107 @@ class SequenceLine(Mobject):
 
         super().__init__(*args, **kwargs)
 
+    def _estimate_bounds(self):
+        if self.bounds is not None:
+            return self.bounds
+        # The first terms plus a geometric spread up to the last one
+        indices = np.unique(
+            np.concatenate(
+                [
+                    np.arange(1, min(self.samples, _BOUNDS_SAMPLES) + 1),
+                    np.geomspace(1, self.samples, _BOUNDS_SAMPLES).astype(
+                        np.int64
+                    ),
+                    [self.samples],
+                ]
+            )
+        )
+        sampled = self.sequence_values.evaluate(indices)
+        return np.nanmin(sampled), np.nanmax(sampled)
+
     def _construct_number_line(self):
-        self.sequence_values = {
-            i: self.sequence(i) for i in range(1, self.samples + 1)
-        }
-        low, high = min(
-            self.converge_value, *self.sequence_values.values()
-        ), max(self.converge_value, *self.sequence_values.values())
+        self.sequence_values = _SequenceValues(
+            self.sequence, self.vectorized_sequence, self.samples
+        )
+        sampled_low, sampled_high = self._estimate_bounds()
+        low = min(self.converge_value, sampled_low)
+        high = max(self.converge_value, sampled_high)
         buff = (high - low) * self.padding_scale / 2
 
+        self.number_line_range = (low - buff, high + buff)
         self.number_line = NumberLine(
-            x_range=[low - buff, high + buff],
+            x_range=list(self.number_line_range),
             length=self.number_line_width,
             include_ticks=False,
         )
 
     def _construct_dots(self):
-        self.sequence_dots = {
-            i: Dot(self.number_line.n2p(val), color=BLUE)
-            .set(true_value=val)
-            .set(seq_num=i)
-            .scale_to_fit_height(
-                _scaler(
-                    abs(val - self.converge_value)
-                    * self.value_scaling.get_value()
-                )
-                * _DOT_SCALE_FACTOR
+        # Updaters are closures rather than bound methods: copying a dot
+        # deep-copies its updaters, and a bound method would drag the whole
+        # field and sequence line along with it.
+        field = self.dot_field = _DotField(self)
+        template = Dot(color=BLUE)
+
+        def build_dot(i):
+            dot = (
+                template.copy()
+                .set(true_value=self.sequence_values[i])
+                .set(seq_num=i)
             )
-            for i, val in self.sequence_values.items()
-        }
+            field.update_dot(dot)
+            dot.add_updater(lambda dot: field.update_dot(dot))
+            return dot
+
+        self.sequence_dots = _LazyMapping(
+            lambda indices: [build_dot(i) for i in indices], self.samples
+        )
         self.converges_dot = Dot(
             self.number_line.n2p(self.converge_value), color=PURPLE
         )
 
-        def dot_scale_updater(z):
-            dist_to_converges_in_line = (
-                self.converge_value - z.true_value
-            ) * self.value_scaling.get_value()
-            z.set_x(
-                self.number_line.n2p(
-                    self.converge_value - dist_to_converges_in_line
-                )[0]
-            )
-            z.scale_to_fit_height(
-                _scaler(abs(dist_to_converges_in_line)) * _DOT_SCALE_FACTOR
+        self.lod_dots = VGroup()
+        if self.lod_pixel_radius is not None:
+            # Every term's position is needed to group them
+            self.sequence_values.evaluate_all()
+            field.update_lod_dots(self.lod_dots)
+            self.lod_dots.add_updater(
+                lambda group: field.update_lod_dots(group)
             )
 
-        def dot_color_updater(z):
-            if (
-                abs(self.converge_value - z.true_value) + EPSILON_CORRECTION
-                > self.epsilon.get_value()
-            ):
-                z.set_color(BLUE)
-            else:
-                if self.epsilon_changes_color:
-                    z.set_color(GREEN)
-
-        for dot in self.sequence_dots.values():
-            dot.add_updater(dot_scale_updater)
-            dot.add_updater(dot_color_updater)
-
     def _construct_texts(self):
         self.converges_text = MathTex(str(self.converge_value)).next_to(
             self.converges_dot, UP
         )
 
         def sequence_text_value(i):
+            xn_text = f"x_{{{i}}}=" if self.show_xn_text else ""
             if self.sequence_str is not None:
-                return self.sequence_str(i)
-            return f"{self.sequence_values[i]:.4}"
+                return xn_text + self.sequence_str(i)
+            return f"{xn_text}{self.sequence_values[i]:.4}"
+
+        def build_texts(indices):
+            # One MathTex for the whole batch, split into a part per text.
+            # manim still compiles every part on its own to split it, so
+            # this builds texts ahead of need rather than saving LaTeX runs.
+            # Every part is moved next to its dot, so the default separator
+            # is fine; one that draws no glyphs would throw the split off.
+            tex = MathTex(*[sequence_text_value(i) for i in indices])
+            texts = []
+            for i, text in zip(indices, tex.submobjects):
+                text.next_to(self.dot_field.top(i), UP).set(seq_num=i)
+                text.add_updater(
+                    lambda z: z.next_to(self.dot_field.top(z.seq_num), UP)
+                )
+                texts.append(text)
+            return texts
 
-        self.sequence_texts = {}
-        for i in range(1, self.text_samples + 1):
-            xn_text = f"x_{{{i}}}=" if self.show_xn_text else ""
-            self.sequence_texts[i] = MathTex(
-                f"{xn_text}{sequence_text_value(i)}"
-            ).next_to(self.sequence_dots[i], UP).set(seq_num=i)
-            self.sequence_texts[i].add_updater(
-                lambda z: z.next_to(self.sequence_dots[z.seq_num], UP)
-            )
+        self.sequence_texts = _LazyMapping(
+            build_texts, self.text_samples, _TEXT_BATCH_SIZE
+        )
+
+    def prefetch_texts(self, *indices: int):
+        # Compiles the given sequence texts together ahead of time
+        self.sequence_texts.prefetch(indices)
 
     def _find_interval_endpoints(self):
         above_mult = 0 if self.interval_direction == "below" else 1
@@ -166,58 +448,77 @@ class SequenceLine(Mobject):
         )
         return start, end
 
-    def _get_interval(self):
-        start, end = self._find_interval_endpoints()
-        return _Interval(
-            start=start,
-            end=end,
-            color=YELLOW,
-        ).shift(DOWN * DEFAULT_MOBJECT_TO_MOBJECT_BUFFER)
-
     def _construct_interval(self):
-        self.interval = self._get_interval()
+        self.interval = _Interval(color=YELLOW)
+        offset = DOWN * DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
 
         def interval_updater(z):
-            z.become(self._get_interval())
+            start, end = self._find_interval_endpoints()
+            z.set_endpoints(start + offset, end + offset)
 
+        interval_updater(self.interval)
         self.interval.add_updater(interval_updater)
 
-    def _get_epsilon_text(self):
-        return MathTex(
-            f"{self.epsilon.get_value():.4}",
-            color=YELLOW,
-            font_size=32,
-        ).next_to(self.interval, DOWN, buff=0.3)
+    def _get_epsilon_text_value(self):
+        return f"{self.epsilon.get_value():.4}"
 
     def _construct_epsilon_text(self):
-        self.epsilon_text = self._get_epsilon_text()
+        self.epsilon_text = GlyphLabel(
+            self._get_epsilon_text_value(), font_size=32, text_color=YELLOW
+        ).next_to(self.interval, DOWN, buff=0.3)
 
         def epsilon_text_updater(z):
-            z.become(self._get_epsilon_text())
+            z.set_text(self._get_epsilon_text_value()).next_to(
+                self.interval, DOWN, buff=0.3
+            )
 
         self.epsilon_text.add_updater(epsilon_text_updater)
 
-    def _get_N_value(self):
-        for i, val in self.sequence_values.items():
-            if (
-                abs(self.converge_value - val) + EPSILON_CORRECTION
-                < self.epsilon.get_value()
-            ):
-                return i
-        return 1
-
-    def _get_N_label(self):
-        N = self._get_N_value()
-        N_label = MathTex(f"N={N}", font_size=32, color=GREEN).next_to(
-            self.sequence_dots[N], UP
+    def _construct_N_index(self):
+        # N is the first index within epsilon of the limit, which is the first
+        # index where the running minimum distance drops below epsilon. The
+        # running minimum never increases, so it can be binary searched even
+        # when the sequence itself isn't monotone. It's negated so it's
+        # ascending for searchsorted, and only built as far as it's needed.
+        self.negated_min_dists = np.empty(self.samples)
+        self.N_indexed = 0
+
+    def _extend_N_index(self):
+        start = self.N_indexed
+        stop = min(start + _CHUNK_SIZE, self.samples)
+        values = self.sequence_values.prefix(stop)[start:]
+        dists = np.abs(self.converge_value - values) + EPSILON_CORRECTION
+        if start > 0:
+            dists[0] = min(dists[0], -self.negated_min_dists[start - 1])
+        np.negative(
+            np.minimum.accumulate(dists),
+            out=self.negated_min_dists[start:stop],
         )
-        return N_label
+        self.N_indexed = stop
+
+    def _get_N_value(self):
+        while True:
+            i = np.searchsorted(
+                self.negated_min_dists[: self.N_indexed],
+                -self.epsilon.get_value(),
+                side="right",
+            )
+            if i < self.N_indexed:
+                return int(i) + 1
+            if self.N_indexed == self.samples:
+                return 1
+            self._extend_N_index()
 
     def _construct_N_label(self):
-        self.N_label = self._get_N_label()
+        self._construct_N_index()
+        N = self._get_N_value()
+        self.N_label = GlyphLabel(
+            f"N={N}", font_size=32, text_color=GREEN
+        ).next_to(self.dot_field.top(N), UP)
 
         def N_label_updater(z):
-            z.become(self._get_N_label())
+            N = self._get_N_value()
+            z.set_text(f"N={N}").next_to(self.dot_field.top(N), UP)
 
         self.N_label.add_updater(N_label_updater)
 
@@ -225,7 +526,8 @@ class SequenceLine(Mobject):
 class SequenceLineTest(Scene):
     def construct(self):
         sequence_line = SequenceLine(
-            sequence=lambda n: (10**n - 1) / 10**n,
+            sequence=None,
+            vectorized_sequence=lambda n: 1 - 10.0**-n,
             converge_value=1,
             sequence_str=lambda n: "0." + ("9" * n),
             samples=100,
@@ -280,3 +582,32 @@ class SequenceLineTest(Scene):
         self.wait()
         self.play(sequence_line.value_scaling.animate.set_value(500))
         self.wait()
+
+
+class SequenceLineLODTest(Scene):
+    def construct(self):
+        sequence_line = SequenceLine(
+            sequence=None,
+            vectorized_sequence=lambda n: 1 - 1 / n,
+            converge_value=1,
+            samples=10**6,
+            number_line_width=self.camera.frame_width,
+            interval_direction="below",
+            lod_pixel_radius=4,
+        )
+        sequence_line.epsilon.set_value(0.1)
+        sequence_line.epsilon_changes_color = True
+        self.add(
+            sequence_line.number_line,
+            sequence_line.lod_dots,
+            sequence_line.converges_dot,
+            sequence_line.interval,
+            sequence_line.epsilon_text,
+            sequence_line.N_label,
+        )
+        self.wait()
+        self.play(sequence_line.epsilon.animate.set_value(0.001))
+        self.play(sequence_line.value_scaling.animate.set_value(100))
+        self.play(sequence_line.epsilon.animate.set_value(0.00001))
+        self.play(sequence_line.value_scaling.animate.set_value(10000))
+        self.wait()
@@ -1,9 +1,79 @@
 from manim import *
+from manim.animation.composition import DEFAULT_LAGGED_START_LAG_RATIO
 import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, namedtuple
 from lib.misc.compose_animations import ComposeAnimations
+from lib.misc.point_buffers import StackedPoints
+from lib.misc.equivalence import EquivalenceRegistry, relabeled
 
 DEFAULT_LABEL_FONT = TexFontTemplates.american_typewriter
 
+LabelCacheInfo = namedtuple(
+    "LabelCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class LabelCache:
+    # Bounded LRU of bucket labels that are already compiled and scaled, keyed
+    # by (label, font, label_scaling, bucket_height, max_width). Labels are
+    # handed out as copies, so callers are free to move them.
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[tuple, Mobject] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: tuple):
+        return key in self.entries
+
+    def put(self, key: tuple, label: Mobject):
+        self.entries[key] = label
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def get(self, key: tuple, build: Callable[[], Mobject]) -> Mobject:
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.put(key, build())
+        return self.entries[key].copy()
+
+    def cache_info(self):
+        return LabelCacheInfo(
+            self.hits, self.misses, self.maxsize, len(self.entries)
+        )
+
+    def cache_clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+label_cache = LabelCache()
+
+_outline_prototype = None
+
+
+def _get_outline_prototype():
+    # The base and sides every Bucket starts as a copy of, built once, already
+    # centered
+    global _outline_prototype
+    if _outline_prototype is None:
+        base = Line()
+        left = Line(start=base.get_start(), end=base.end + RIGHT / 2)
+        right = Line(start=base.get_end(), end=base.start + LEFT / 2)
+        left.set_angle(PI / 2 + PI / 24)
+        right.set_angle(PI / 2 - PI / 24)
+        outline = VGroup(base, left, right)
+        outline.center()
+        _outline_prototype = (base, left, right, outline.height)
+    return _outline_prototype
+
 
 class Bucket(VGroup):
     def __init__(
@@ -14,17 +84,14 @@ class Bucket(VGroup):
         **kwargs,
     ):
         super().__init__(**kwargs)
-        base = Line()
-        left = Line(start=base.get_start(), end=base.end + RIGHT / 2)
-        right = Line(start=base.get_end(), end=base.start + LEFT / 2)
-        left.set_angle(PI / 2 + PI / 24)
-        right.set_angle(PI / 2 - PI / 24)
+        *prototype_lines, bucket_height = _get_outline_prototype()
+        base, left, right = (line.copy() for line in prototype_lines)
 
         items_anchor = base
 
         self.add(base, left, right)
 
-        self.bucket_height = self.height
+        self.bucket_height = bucket_height
         self.items_anchor = items_anchor
         self.base = base
         self.left = left
@@ -34,32 +101,87 @@ class Bucket(VGroup):
         self.label_scaling = label_scaling
 
         self.label = None
+        self.label_text = None
         self.surrounding_lines = None
+        # Items put in so far, in order, as the keys of a dict so checking and
+        # taking one out doesn't scan the rest
+        self.contents = {}
 
+        self.sort_submobjects()
         if label is not None:
             self.relabel(label)
 
-        self.center()
-        self.sort_submobjects()
+    @classmethod
+    def grid(
+        cls,
+        labels,
+        label_font=DEFAULT_LABEL_FONT,
+        label_scaling=1,
+        rows=None,
+        cols=None,
+        **kwargs,
+    ):
+        # A bucket for each label, arranged in a grid. Labels go through
+        # label_cache like relabel's do, so each distinct label is compiled
+        # once and repeated ones are cache hits.
+        buckets = [
+            cls(
+                label=label,
+                label_font=label_font,
+                label_scaling=label_scaling,
+            )
+            for label in labels
+        ]
+        return VGroup(*buckets).arrange_in_grid(rows=rows, cols=cols, **kwargs)
+
+    def _label_key(self, label):
+        return (
+            label,
+            self.label_font.body,
+            self.label_scaling,
+            self.bucket_height,
+            self.base.get_length() * 0.9,
+        )
+
+    def _fit_label_tex(self, label_tex):
+        max_width = self.base.get_length() * 0.9
+        label_tex.scale_to_fit_height(
+            self.bucket_height * 0.1 * self.label_scaling
+        )
+        if label_tex.width > max_width:
+            label_tex.set(width=max_width)
+        return label_tex
+
+    def _get_label_tex(self, label):
+        return label_cache.get(
+            self._label_key(label),
+            lambda: self._fit_label_tex(
+                MathTex(
+                    r"\left[", label, r"\right]", tex_template=self.label_font
+                )
+            ),
+        )
 
     def relabel(self, label):
+        return self._attach_label(label, self._get_label_tex(label))
+
+    def _attach_label(self, label, label_tex):
         if self.label is not None:
             self.remove(self.label)
         if self.surrounding_lines is not None:
             self.remove(self.surrounding_lines)
+        self._set_label(label, *self._build_label(label_tex))
+        return self
 
-        max_width = self.base.get_length() * 0.9
+    def _build_label(self, label_tex):
+        # Places label_tex on the bucket and builds the lines around it,
+        # without adding either to the bucket
         stroke_width = 2
         buff = 0.05
-        label_tex = MathTex(r"\left[", label, r"\right]", tex_template=self.label_font)
-        label_tex.scale_to_fit_height(
-            self.bucket_height * 0.1 * self.label_scaling
-        )
-        label_tex.next_to(
-            self.base, UP, buff=(self.left.height - label_tex.height) / 2
+        # Centered halfway up the sides
+        label_tex.move_to(
+            self.base.get_critical_point(UP) + UP * self.left.height / 2
         )
-        if label_tex.width > max_width:
-            label_tex.set(width=max_width)
 
         surrounding_lines = VGroup(
             Line(stroke_width=stroke_width).shift(
@@ -71,21 +193,28 @@ class Bucket(VGroup):
             Line(stroke_width=stroke_width).shift(DOWN * buff),
             Line(stroke_width=stroke_width).shift(DOWN * 2 * buff),
         ).move_to(label_tex)
+        return label_tex, surrounding_lines
+
+    def _set_label(self, label, label_tex, surrounding_lines):
         self.add(label_tex, surrounding_lines)
 
         self.label = label_tex
+        self._set_label_text(label)
         self.items_anchor = self.label
         self.surrounding_lines = surrounding_lines
         self.sort_submobjects()
         return self
 
+    def _set_label_text(self, label):
+        self.label_text = label
+        relabeled(self)
+
     @override_animate(relabel)
     def _relabel_animate(self, label, anim_args={}):
-        target = self.generate_target()
-        target.relabel(label)
-        return MoveToTarget(self, **anim_args)
+        return RelabelBucket(self, label, **anim_args)
 
     def put_in(self, obj):
+        self.contents[obj] = None
         return self
 
     @override_animate(put_in)
@@ -93,6 +222,7 @@ class Bucket(VGroup):
         return PutInBucket(obj, self, *args, **kwargs)
 
     def take_out(self, obj):
+        self.contents.pop(obj, None)
         obj.next_to(self, UP)
         return self
 
@@ -101,17 +231,57 @@ class Bucket(VGroup):
         return TakeOutBucket(obj, self, *args, **kwargs)
 
 
+class RelabelBucket(AnimationGroup):
+    # Transforms the label and the lines around it into the new ones in place,
+    # instead of copying the whole bucket for a MoveToTarget. A bucket
+    # without a label fades the new one in.
+    def __init__(self, bucket, label, **kwargs):
+        self.bucket = bucket
+        self.label_text = label
+        self.new_label, self.new_lines = bucket._build_label(
+            bucket._get_label_tex(label)
+        )
+        if bucket.label is None:
+            animations = [FadeIn(self.new_label, self.new_lines)]
+        else:
+            animations = [
+                Transform(bucket.label, self.new_label),
+                Transform(bucket.surrounding_lines, self.new_lines),
+            ]
+        super().__init__(*animations, **kwargs)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.bucket.label is None:
+            scene.remove(self.new_label, self.new_lines)
+            self.bucket._set_label(
+                self.label_text, self.new_label, self.new_lines
+            )
+        else:
+            self.bucket._set_label_text(self.label_text)
+
+
 class PutInBucket(ComposeAnimations):
     def __init__(
         self,
         item,
-        bucket,
+        bucket=None,
         *args,
+        # An EquivalenceRegistry to look the bucket up in when none is given
+        registry=None,
         move_above_weight=1 / 2,
         move_into_weight=1 / 2,
         **kwargs,
     ):
-        super().__init__(item, *args, **kwargs)
+        if bucket is None:
+            if registry is None:
+                raise ValueError("PutInBucket needs a bucket or a registry")
+            bucket = registry.bucket_for(item)
+            if bucket is None:
+                raise ValueError(f"No bucket registered for {item}")
+        # move_into resumes from where move_above ended rather than replaying
+        # it on every frame
+        super().__init__(item, *args, skip_finished_directives=True, **kwargs)
         self.bucket = bucket
         self.move_above_weight = move_above_weight
         self.move_into_weight = move_into_weight
@@ -120,36 +290,50 @@ class PutInBucket(ComposeAnimations):
             (move_into_weight, PutInBucket.move_into),
         )
 
-    def move_above(self, alpha: float):
-        self.mobject.become(self.starting_mobject)
-        to_above_vector = (
-            self.bucket.get_critical_point(UP)
-            - self.starting_mobject.get_center()
+    def begin(self):
+        # The path is a scale and shift of the starting geometry, so the
+        # vectors it follows are resolved once, before the first frame
+        start_center = self.mobject.get_center()
+        self.to_above_vector = (
+            self.bucket.get_critical_point(UP) - start_center
         )
-        self.mobject.shift(
-            to_above_vector * rate_functions.ease_in_cubic(alpha)
+        # Where move_into starts from
+        self.into_center = (
+            start_center + self.to_above_vector
+            if self.move_above_weight >= 0
+            else start_center
+        )
+        self.into_bucket_vector = (
+            self.bucket.items_anchor.get_critical_point(UP) - self.into_center
         )
+        self.family_with_points = [
+            member
+            for member in self.mobject.get_family()
+            if len(member.points)
+        ]
+        super().begin()
 
-    def _normalize(self):
-        if self.move_above_weight < 0:
-            self.mobject.become(self.starting_mobject)
-        else:
-            self.move_above(1)
+    def move_above(self, alpha: float):
+        self.mobject.shift(
+            self.to_above_vector * rate_functions.ease_in_cubic(alpha)
+        )
 
     def move_into(self, alpha: float):
-        self._normalize()
-        into_bucket_vector = (
-            self.bucket.items_anchor.get_critical_point(UP)
-            - self.mobject.get_center()
+        # scale_to_fit_height about the center, then a shift, without
+        # measuring the bounding box
+        scale = rate_functions.ease_in_cubic(1 - alpha)
+        center = self.into_center + self.into_bucket_vector * (
+            rate_functions.ease_out_cubic(alpha)
         )
-        self.mobject.scale_to_fit_height(
-            rate_functions.ease_in_cubic(1 - alpha)
-            * self.starting_mobject.height
-        ).shift(into_bucket_vector * rate_functions.ease_out_cubic(alpha))
+        for member in self.family_with_points:
+            member.points -= self.into_center
+            member.points *= scale
+            member.points += center
 
     def clean_up_from_scene(self, scene):
-        self.mobject.become(self.starting_mobject)
+        self.checkpoints[0].restore()
         scene.remove(self.mobject)
+        self.bucket.put_in(self.mobject)
 
 
 class TakeOutBucket(ComposeAnimations):
@@ -163,26 +347,268 @@ class TakeOutBucket(ComposeAnimations):
         extra_directives=[],
         **kwargs,
     ):
-        super().__init__(item, *args, **kwargs)
+        super().__init__(item, *args, skip_finished_directives=True, **kwargs)
         self.move_above = move_above
         self.bucket = bucket
         self.add_directives(
             (move_out_weight, TakeOutBucket.move_out), *extra_directives
         )
 
+    def begin(self):
+        # Resolved once, before the first frame, for move_out and for any
+        # extra_directives that want them
+        self.start_center = self.mobject.get_center()
+        self.start_height = self.mobject.height
+        self.anchor_point = self.bucket.items_anchor.get_critical_point(UP)
+        self.target_center = (
+            self.mobject.copy().next_to(self.bucket, UP).get_center()
+            if self.move_above
+            else self.start_center
+        )
+        self.family_with_points = [
+            member
+            for member in self.mobject.get_family()
+            if len(member.points)
+        ]
+        super().begin()
+
     def move_out(self, alpha: float):
-        self.mobject.become(self.starting_mobject).move_to(
-            self.bucket.items_anchor.get_critical_point(UP)
+        # Grows from the anchor point towards the target center: a
+        # scale_to_fit_height and shift of the starting geometry
+        scale = rate_functions.ease_in_cubic(alpha)
+        center = self.anchor_point + scale * (
+            self.target_center - self.anchor_point
         )
-        target = (
-            self.starting_mobject.copy().next_to(self.bucket, UP).get_center()
-            if self.move_above
-            else self.starting_mobject.get_center()
+        for member in self.family_with_points:
+            member.points -= self.start_center
+            member.points *= scale
+            member.points += center
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.bucket.contents.pop(self.mobject, None)
+
+
+class _BatchBucketAnimation(Animation, ABC):
+    # Item i runs over [i * lag_ratio, i * lag_ratio + 1] of a timeline of
+    # length (n - 1) * lag_ratio + 1, as in a LaggedStart. Every frame, each
+    # item is scaled about its starting center and shifted, and that is
+    # applied to all of the stacked points at once.
+    def __init__(
+        self,
+        items,
+        bucket,
+        *args,
+        lag_ratio=DEFAULT_LAGGED_START_LAG_RATIO,
+        # Linear, like PutInBucket and TakeOutBucket: ComposeAnimations
+        # doesn't apply a rate_func to its directives
+        item_rate_func=linear,
+        rate_func=linear,
+        **kwargs,
+    ):
+        if not isinstance(items, Mobject):
+            items = Group(*items)
+        self.items = list(items.submobjects)
+        self.bucket = bucket
+        self.lag_ratio = lag_ratio
+        self.item_rate_func = item_rate_func
+        self.lag_offsets = np.arange(len(self.items)) * lag_ratio
+        self.lag_span = max(len(self.items) - 1, 0) * lag_ratio + 1
+        # Same length as a LaggedStart of one second animations
+        kwargs.setdefault("run_time", self.lag_span)
+        super().__init__(items, *args, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.stack = StackedPoints(self.items)
+        self.start_points = self.stack.points.copy()
+        self.start_centers = np.array(
+            [item.get_center() for item in self.items]
+        ).reshape(-1, 3)
+        # Points relative to the starting center of their item
+        self.relative_points = (
+            self.start_points - self.start_centers[self.stack.item_index]
+        )
+        self.prepare()
+        super().begin()
+
+    @abstractmethod
+    def prepare(self):
+        # Per-play setup, run once the starting positions are known
+        ...
+
+    @abstractmethod
+    def item_transforms(self, alphas):
+        # Scale factor and new center for each item
+        ...
+
+    def item_alphas(self, alpha: float):
+        alphas = np.clip(alpha * self.lag_span - self.lag_offsets, 0, 1)
+        if self.item_rate_func is linear:
+            return alphas
+        # Rate functions take scalars, and items that haven't started or
+        # have finished are already at 0 or 1
+        for i in np.flatnonzero((alphas > 0) & (alphas < 1)):
+            alphas[i] = self.item_rate_func(alphas[i])
+        return alphas
+
+    def interpolate_mobject(self, alpha: float):
+        if not self.items:
+            return
+        alpha = self.rate_func(alpha)
+        scales, centers = self.item_transforms(self.item_alphas(alpha))
+        index = self.stack.item_index
+        np.multiply(
+            self.relative_points,
+            scales[index, np.newaxis],
+            out=self.stack.points,
+        )
+        self.stack.points += centers[index]
+
+    def clean_up_from_scene(self, scene):
+        self.stack.release()
+        super().clean_up_from_scene(scene)
+
+
+class BatchPutInBucket(_BatchBucketAnimation):
+    # A LaggedStart of PutInBucket for many items, moved together
+    def __init__(
+        self,
+        items,
+        bucket,
+        *args,
+        move_above_weight=1 / 2,
+        move_into_weight=1 / 2,
+        **kwargs,
+    ):
+        super().__init__(items, bucket, *args, **kwargs)
+        self.move_above_weight = move_above_weight
+        self.move_into_weight = move_into_weight
+
+    def prepare(self):
+        # As in ComposeAnimations, a negative weight leaves the step out and
+        # a zero weight plays it instantly
+        above_weight = max(self.move_above_weight, 0)
+        into_weight = max(self.move_into_weight, 0)
+        # Part of each item's own timeline spent moving above the bucket
+        self.above_share = (
+            above_weight / (above_weight + into_weight)
+            if into_weight > 0
+            else 1
+        )
+        if self.move_above_weight >= 0:
+            self.to_above = (
+                self.bucket.get_critical_point(UP) - self.start_centers
+            )
+        else:
+            self.to_above = np.zeros_like(self.start_centers)
+        self.into = self.bucket.items_anchor.get_critical_point(UP) - (
+            self.start_centers + self.to_above
+        )
+
+    def item_transforms(self, alphas):
+        share = self.above_share
+        if share > 0:
+            above = np.minimum(alphas / share, 1)
+        else:
+            above = np.ones_like(alphas)
+        if share < 1:
+            into = np.clip((alphas - share) / (1 - share), 0, 1)
+        else:
+            into = np.zeros_like(alphas)
+        # ease_in_cubic and ease_out_cubic
+        eased_above = above**3
+        eased_into = 1 - (1 - into) ** 3
+        centers = (
+            self.start_centers
+            + self.to_above * eased_above[:, np.newaxis]
+            + self.into * eased_into[:, np.newaxis]
+        )
+        return (1 - into) ** 3, centers
+
+    def clean_up_from_scene(self, scene):
+        np.copyto(self.stack.points, self.start_points)
+        super().clean_up_from_scene(scene)
+        scene.remove(self.mobject, *self.items)
+        self.bucket.contents.update(dict.fromkeys(self.items))
+
+
+class BatchTakeOutBucket(_BatchBucketAnimation):
+    # A LaggedStart of TakeOutBucket for many items, moved together
+    def __init__(self, items, bucket, *args, move_above=True, **kwargs):
+        super().__init__(items, bucket, *args, **kwargs)
+        self.move_above = move_above
+
+    def prepare(self):
+        self.anchor = self.bucket.items_anchor.get_critical_point(UP)
+        if self.move_above:
+            # Where next_to(bucket, UP) puts each item
+            bottoms = np.array(
+                [item.get_critical_point(DOWN) for item in self.items]
+            ).reshape(-1, 3)
+            targets = (
+                self.bucket.get_critical_point(UP)
+                + UP * DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
+                + self.start_centers
+                - bottoms
+            )
+        else:
+            targets = self.start_centers
+        self.to_target = targets - self.anchor
+
+    def item_transforms(self, alphas):
+        eased = alphas**3
+        return eased, self.anchor + self.to_target * eased[:, np.newaxis]
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        for item in self.items:
+            self.bucket.contents.pop(item, None)
+
+
+class BatchBucketBenchmark(Scene):
+    # Time per frame of a LaggedStart of PutInBucket versus BatchPutInBucket
+    # as the number of items grows.
+    def time_per_frame(self, anim, frames=30):
+        anim.begin()
+        start = time.perf_counter()
+        for frame in range(frames + 1):
+            anim.interpolate(frame / frames)
+        elapsed = time.perf_counter() - start
+        anim.finish()
+        return elapsed / (frames + 1)
+
+    def construct(self):
+        bucket = Bucket()
+        for count in [10, 100, 1000]:
+            dots = VGroup(*[Dot() for _ in range(count)]).arrange_in_grid()
+            dots.next_to(bucket, UP)
+            lagged = self.time_per_frame(
+                LaggedStart(*[PutInBucket(dot, bucket) for dot in dots])
+            )
+            batch = self.time_per_frame(BatchPutInBucket(dots, bucket))
+            logger.info(
+                f"{count} items: LaggedStart {lagged * 1e3:.2f}ms/frame, "
+                f"batch {batch * 1e3:.2f}ms/frame"
+            )
+
+
+class BucketBenchmark(Scene):
+    def construct(self):
+        count = 500
+        start = time.perf_counter()
+        for _ in range(count):
+            Bucket()
+        logger.info(
+            f"{count} Bucket(): {time.perf_counter() - start:.3f}s"
+        )
+
+        labels = [f"\\frac{{{i}}}{{{i + 1}}}" for i in range(count)]
+        start = time.perf_counter()
+        Bucket.grid(labels, label_scaling=2)
+        logger.info(
+            f"Bucket.grid with {count} labels: "
+            f"{time.perf_counter() - start:.3f}s"
         )
-        to_above_vector = target - self.mobject.get_center()
-        self.mobject.scale_to_fit_height(
-            rate_functions.ease_in_cubic(alpha) * self.starting_mobject.height
-        ).shift(to_above_vector * rate_functions.ease_in_cubic(alpha))
 
 
 class BucketTest(Scene):
@@ -238,24 +664,14 @@ class BucketTest(Scene):
         dots = VGroup(*[Dot() for _ in range(5)]).arrange().next_to(bucket, UP)
         self.add(bucket, dots)
         self.play(
-            LaggedStart(
-                *[
-                    TakeOutBucket(
-                        dots[len(dots) - i - 1], bucket, move_above=False
-                    )
-                    for i in range(len(dots))
-                ],
-                lag_ratio=0.02,
+            BatchTakeOutBucket(
+                dots[::-1], bucket, move_above=False, lag_ratio=0.02
             )
         )
         self.wait()
         self.play(
-            LaggedStart(
-                *[
-                    PutInBucket(dots[i], bucket, move_above_weight=-1)
-                    for i in range(len(dots))
-                ],
-                lag_ratio=0.02,
+            BatchPutInBucket(
+                dots, bucket, move_above_weight=-1, lag_ratio=0.02
             )
         )
         self.wait()
@@ -272,12 +688,41 @@ class BucketTest(Scene):
         self.wait()
         self.clear()
 
+    def test_registry(self):
+        self.add(Tex("Registry").to_edge(UP))
+        registry = EquivalenceRegistry()
+        buckets = VGroup(
+            *[
+                registry.register(Bucket(label=label))
+                for label in [r"\frac{1}{2}", r"\frac{2}{3}"]
+            ]
+        ).arrange(buff=2)
+        items = (
+            VGroup(
+                *[
+                    MathTex(f"\\frac{{{a}}}{{{b}}}")
+                    for a, b in [(2, 4), (4, 6), (3, 6)]
+                ]
+            )
+            .arrange()
+            .next_to(buckets, UP)
+        )
+        self.add(buckets, items)
+        for item in items:
+            self.play(PutInBucket(item, registry=registry))
+        self.wait()
+        self.clear()
+
     def test_relabel(self):
         self.add(Tex("Relabel").to_edge(UP))
         bucket = Bucket(label="0.9")
         self.add(bucket)
         self.play(bucket.animate.relabel("0.99"))
         self.wait()
+        unlabeled = Bucket().next_to(bucket, DOWN)
+        self.add(unlabeled)
+        self.play(RelabelBucket(unlabeled, "0.9"))
+        self.wait()
 
     def construct(self):
         self.test_looks()
@@ -285,4 +730,5 @@ class BucketTest(Scene):
         self.test_takeout()
         self.test_collective()
         self.test_compare()
+        self.test_registry()
         self.test_relabel()
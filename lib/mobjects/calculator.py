@@ -1,4 +1,163 @@
 from manim import *
+import manim
+import ast
+import hashlib
+import math
+import operator
+import pickle
+import re
+from pathlib import Path
+from lib.misc.glyph_label import GlyphLabel
+
+_KEY_LABELS = [
+    r"\text{AC}",
+    r"\text{C}",
+    r"\text{M}-",
+    r"\text{M}+",
+    "7",
+    "8",
+    "9",
+    r"\div",
+    "4",
+    "5",
+    "6",
+    r"\times",
+    "1",
+    "2",
+    "3",
+    "-",
+    "0",
+    ".",
+    "=",
+    "+",
+]
+
+_keypads: dict[tuple, VGroup] = {}
+# Bump when _build_keypad changes how keypads look, so pickles of the old
+# layout aren't loaded
+_KEYPAD_LAYOUT_VERSION = 1
+
+# Characters type_sequence takes that aren't key labels themselves
+_TYPED_KEYS = {"*": r"\times", "×": r"\times", "/": r"\div", "÷": r"\div"}
+# How keys show up on the screen
+_SCREEN_SYMBOLS = {r"\times": "×", r"\div": "÷"}
+_OPERATORS = {"+", "-", "×", "÷"}
+# What the screen shows when "=" can't evaluate it, e.g. after "1÷0"
+_ERROR_SCREEN = "Error"
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPERATORS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _build_keypad(
+    button_color, label_color, label_font_size, text_label_font_size, key_buff
+):
+    # A button and a label for every key, laid out in a grid
+    key_labels = [
+        MathTex(
+            label,
+            color=label_color,
+            font_size=(
+                text_label_font_size if "text" in label else label_font_size
+            ),
+        )
+        for label in _KEY_LABELS
+    ]
+    key_height = max(*(key.height for key in key_labels))
+    key_width = max(*(key.width for key in key_labels))
+
+    keypad = VGroup()
+    for key_label in key_labels:
+        key_button_outline = RoundedRectangle(
+            width=key_width + 2 * key_buff,
+            height=key_height + 2 * key_buff,
+            fill_color=button_color,
+            fill_opacity=1,
+            corner_radius=0.1,
+        ).move_to(key_label)
+        keypad.add(VGroup(key_button_outline, key_label))
+    return keypad.arrange_in_grid(rows=5, cols=4)
+
+
+def _get_keypad(*key) -> VGroup:
+    # Built once per process, and kept in the tex directory across runs so
+    # the key labels don't go through LaTeX again. The labels are compiled
+    # with the configured template, so it's part of what the keypad depends
+    # on.
+    tex_template = config.tex_template
+    tex_setup = (
+        tex_template.body,
+        tex_template.tex_compiler,
+        tex_template.output_format,
+    )
+    if (tex_setup, key) in _keypads:
+        return _keypads[tex_setup, key]
+
+    digest = hashlib.sha256(
+        repr(
+            (
+                manim.__version__,
+                _KEYPAD_LAYOUT_VERSION,
+                _KEY_LABELS,
+                tex_setup,
+                key,
+            )
+        ).encode()
+    ).hexdigest()[:16]
+    path = Path(config.get_dir("tex_dir")) / "keypads" / f"{digest}.pickle"
+    keypad = None
+    if path.exists():
+        try:
+            keypad = pickle.loads(path.read_bytes())
+        except Exception:
+            # Unpickling can fail in many ways, e.g. a pickle written by
+            # other versions of manim or numpy, and it's only a cache
+            keypad = None
+    if keypad is None:
+        keypad = _build_keypad(*key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(pickle.dumps(keypad))
+        except (OSError, pickle.PicklingError):
+            pass
+    _keypads[tex_setup, key] = keypad
+    return keypad
+
+
+def _evaluate(expression: str):
+    # Arithmetic on the numbers and operators of the keypad, without eval
+    def visit(node):
+        if isinstance(node, ast.Expression):
+            return visit(node.body)
+        if isinstance(node, ast.Constant) and isinstance(
+            node.value, (int, float)
+        ):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return _UNARY_OPERATORS[type(node.op)](visit(node.operand))
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            return _BINARY_OPERATORS[type(node.op)](
+                visit(node.left), visit(node.right)
+            )
+        raise ValueError(f"Can't evaluate {expression!r}")
+
+    # Leading zeros aren't valid Python, but a calculator ignores them
+    source = re.sub(r"(?<![\d.])0+(?=\d)", "", expression)
+    source = source.replace("×", "*").replace("÷", "/")
+    try:
+        value = visit(ast.parse(source, mode="eval"))
+    except (SyntaxError, ZeroDivisionError) as error:
+        raise ValueError(f"Can't evaluate {expression!r}") from error
+    if not math.isfinite(value):
+        raise ValueError(f"Can't evaluate {expression!r}")
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.10g}"
 
 
 class Calculator(VGroup):
@@ -11,6 +170,10 @@ class Calculator(VGroup):
         label_pressed_color=BLACK,
         calculator_color=BLACK,
         screen_color=BLACK,
+        label_font_size=DEFAULT_FONT_SIZE,
+        # For the keys with words on them
+        text_label_font_size=36,
+        key_buff=0.15,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -19,60 +182,27 @@ class Calculator(VGroup):
         self.label_unpressed_color = label_unpressed_color
         self.label_pressed_color = label_pressed_color
 
-        self.key_buff = 0.15
-
-        inside_group = VGroup()
-        labels = [
-            r"\text{AC}",
-            r"\text{C}",
-            r"\text{M}-",
-            r"\text{M}+",
-            "7",
-            "8",
-            "9",
-            r"\div",
-            "4",
-            "5",
-            "6",
-            r"\times",
-            "1",
-            "2",
-            "3",
-            "-",
-            "0",
-            ".",
-            "=",
-            "+",
-        ]
+        self.key_buff = key_buff
+        self.label_font_size = label_font_size
+
+        # A copy of the shared keypad, so the dicts below point at this
+        # calculator's own keys
+        inside_group = _get_keypad(
+            button_unpressed_color,
+            label_unpressed_color,
+            label_font_size,
+            text_label_font_size,
+            key_buff,
+        ).copy()
+        self.key_groups_dict = dict(zip(_KEY_LABELS, inside_group))
+        self.key_buttons_dict = {
+            label: group[0] for label, group in self.key_groups_dict.items()
+        }
         self.key_labels_dict = {
-            label: MathTex(
-                label,
-                color=self.label_unpressed_color,
-                font_size=36 if "text" in label else DEFAULT_FONT_SIZE,
-            )
-            for label in labels
+            label: group[1] for label, group in self.key_groups_dict.items()
         }
-        self.key_buttons_dict = {}
-        key_height = max(*(key.height for key in self.key_labels_dict.values()))
-        key_width = max(*(key.width for key in self.key_labels_dict.values()))
-
-        key_buttons = []
-        for label, key_label in self.key_labels_dict.items():
-            group = VGroup()
-            key_button_outline = RoundedRectangle(
-                width=key_width + 2 * self.key_buff,
-                height=key_height + 2 * self.key_buff,
-                fill_color=self.button_unpressed_color,
-                fill_opacity=1,
-                corner_radius=0.1,
-            ).move_to(key_label)
-            group.add(key_button_outline, key_label)
-            self.key_buttons_dict[label] = key_button_outline
-
-            key_buttons.append(group)
-            inside_group.add(group)
-
-        inside_group.arrange_in_grid(rows=5, cols=4)
+        key_buttons = list(self.key_groups_dict.values())
+
         self.screen = RoundedRectangle(
             width=inside_group.width,
             height=max(
@@ -94,6 +224,10 @@ class Calculator(VGroup):
         self.add(enclosure)
         self.add(inside_group)
         self.screen_obj = None
+        # Screen text for type_sequence, and whether it shows a result that
+        # typing a number should replace
+        self.screen_label = None
+        self.showing_result = False
 
     def move_obj_to_screen(self, obj):
         if self.screen_obj is not None:
@@ -125,6 +259,67 @@ class Calculator(VGroup):
     def _tap_button_animation(self, button, anim_args={}):
         return TapButtonCalculator(self, button, **anim_args)
 
+    def get_screen_label(self):
+        if self.screen_label is None:
+            self.screen_label = GlyphLabel(font_size=self.label_font_size)
+        return self.screen_label
+
+    def show_on_screen(self, text):
+        label = self.get_screen_label()
+        label.set_text(text)
+        if text:
+            self.move_obj_to_screen(label)
+        return self
+
+    def typing_states(self, text):
+        # The key tapped for each character and what the screen shows after
+        # it. "=" evaluates what's on the screen, and shows _ERROR_SCREEN if
+        # it can't, like dividing by zero. Raises ValueError for a character
+        # there's no key for.
+        screen = (
+            self.screen_label.text
+            if self.screen_label is not None
+            and self.screen_obj is self.screen_label
+            else ""
+        )
+        showing_result = self.showing_result
+        keys = []
+        screens = []
+        for char in text:
+            if char.isspace():
+                continue
+            key = _TYPED_KEYS.get(char, char)
+            if key not in self.key_groups_dict:
+                raise ValueError(f"No key for {char!r} on the calculator")
+            symbol = _SCREEN_SYMBOLS.get(key, key)
+            if symbol == "=":
+                try:
+                    screen = _evaluate(screen) if screen else screen
+                except ValueError:
+                    screen = _ERROR_SCREEN
+                showing_result = True
+            else:
+                # Operators carry on from a result, but not from an error
+                if showing_result and (
+                    symbol not in _OPERATORS or screen == _ERROR_SCREEN
+                ):
+                    screen = ""
+                screen += symbol
+                showing_result = False
+            keys.append(key)
+            screens.append(screen)
+        return keys, screens, showing_result
+
+    def type_sequence(self, text):
+        _, screens, self.showing_result = self.typing_states(text)
+        if screens:
+            self.show_on_screen(screens[-1])
+        return self
+
+    @override_animate(type_sequence)
+    def _type_sequence_animation(self, text, anim_args={}):
+        return TypeSequenceCalculator(self, text, **anim_args)
+
 
 class TapButtonCalculator(Animation):
     def __init__(
@@ -135,17 +330,106 @@ class TapButtonCalculator(Animation):
         rate_func=rate_functions.linear,
         **kwargs,
     ):
+        self.calculator = mobject
         self.button = button
+        # Only the tapped key is animated, so the renderer treats the rest of
+        # the calculator as static and doesn't redraw it every frame
+        super().__init__(
+            mobject.key_groups_dict[button],
+            run_time=run_time,
+            rate_func=rate_func,
+            **kwargs,
+        )
+
+    def begin(self):
+        self.pressed = None
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        # Colors only change when the key goes down and when it comes up
+        pressed = alpha < 0.5
+        if pressed == self.pressed:
+            return
+        if pressed:
+            self.calculator.press_button(self.button)
+        else:
+            self.calculator.unpress_button(self.button)
+        self.pressed = pressed
+
+
+class TypeSequenceCalculator(Animation):
+    # Taps each key in turn and updates the screen when it comes back up.
+    # The screen is a GlyphLabel, so no keystroke goes through LaTeX.
+    def __init__(
+        self,
+        calculator,
+        text,
+        run_time=None,
+        time_per_key=0.25,
+        rate_func=rate_functions.linear,
+        **kwargs,
+    ):
+        self.calculator = calculator
+        self.keys, self.screens, self.showing_result = (
+            calculator.typing_states(text)
+        )
+        label = calculator.get_screen_label()
+        self.start_screen = (
+            label.text if calculator.screen_obj is label else None
+        )
+        if run_time is None:
+            run_time = time_per_key * max(len(self.keys), 1)
+        # The calculator itself, so that the scene keeps treating it as one
+        # mobject; only the tapped keys and the screen text are changed
         super().__init__(
-            mobject, run_time=run_time, rate_func=rate_func, **kwargs
+            calculator,
+            run_time=run_time,
+            rate_func=rate_func,
+            **kwargs,
         )
 
+    def create_starting_mobject(self):
+        # Nothing is interpolated from a starting copy, so don't make one
+        return self.mobject
+
+    def begin(self):
+        self.pressed_index = None
+        # The screen text has to be part of the calculator before the first
+        # frame, or the scene wouldn't draw it
+        label = self.calculator.get_screen_label()
+        if self.calculator.screen_obj is not label:
+            label.set_text("")
+            self.calculator.add(label)
+        super().begin()
+
     def interpolate_mobject(self, alpha: float):
-        self.mobject.become(self.starting_mobject)
-        if alpha < 0.5:
-            self.mobject.press_button(self.button)
+        if not self.keys:
+            return
+        position = alpha * len(self.keys)
+        index = min(int(position), len(self.keys) - 1)
+        pressed = position - index < 0.5
+
+        if self.pressed_index is not None and (
+            not pressed or self.pressed_index != index
+        ):
+            self.calculator.unpress_button(self.keys[self.pressed_index])
+            self.pressed_index = None
+        if pressed and self.pressed_index is None:
+            self.calculator.press_button(self.keys[index])
+            self.pressed_index = index
+
+        if not pressed:
+            screen = self.screens[index]
+        elif index > 0:
+            screen = self.screens[index - 1]
         else:
-            self.mobject.unpress_button(self.button)
+            screen = self.start_screen
+        if screen is not None and screen != self.calculator.screen_label.text:
+            self.calculator.show_on_screen(screen)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        self.calculator.showing_result = self.showing_result
 
 
 class CalculatorTest(Scene):
@@ -153,7 +437,8 @@ class CalculatorTest(Scene):
         calculator = Calculator()
         expr = MathTex(r"1234")
         calculator.move_obj_to_screen(expr)
-        self.add(calculator, expr)
+        # expr is part of the calculator, so it leaves with the screen swap
+        self.add(calculator)
         self.wait()
         self.play(
             Succession(
@@ -165,3 +450,16 @@ class CalculatorTest(Scene):
             )
         )
         self.wait()
+        self.play(calculator.animate.type_sequence("12+34="))
+        self.wait()
+        self.play(calculator.animate.type_sequence("×2÷8="))
+        self.wait()
+        # Zeros after a decimal point aren't leading zeros
+        for typed in ["1.05+1=", "0.05×2=", "3.007=", "10.01=", "007+1="]:
+            self.play(calculator.animate.type_sequence(typed))
+        self.wait()
+        # Errors show on the screen, and typing after one starts over
+        self.play(calculator.animate.type_sequence("1÷0="))
+        self.wait()
+        self.play(calculator.animate.type_sequence("+2="))
+        self.wait()
@@ -1,4 +1,63 @@
 from manim import *
+import numbers
+from lib.misc.point_buffers import FamilySnapshot, StackedPoints
+
+_faces: dict[tuple, tuple[VGroup, Arrow, Arrow]] = {}
+# Hands in continuous mode are drawn at angles in steps of 1/3600 of a turn:
+# a second for the minute hand and 12 seconds for the hour hand
+_ROTATION_STEPS = 3600
+_rotations = None
+
+
+def _get_rotations() -> np.ndarray:
+    # Clockwise rotation matrices for every step of a turn, built once and
+    # shared, so they must not be written to
+    global _rotations
+    if _rotations is None:
+        angles = -TAU * np.arange(_ROTATION_STEPS) / _ROTATION_STEPS
+        cos, sin = np.cos(angles), np.sin(angles)
+        _rotations = np.zeros((_ROTATION_STEPS, 3, 3))
+        _rotations[:, 0, 0] = cos
+        _rotations[:, 0, 1] = -sin
+        _rotations[:, 1, 0] = sin
+        _rotations[:, 1, 1] = cos
+        _rotations[:, 2, 2] = 1
+    return _rotations
+
+
+def _get_face(radius, color, font_size_scale):
+    # The circle, hour labels and center dot, plus the hour and minute hands
+    # pointing at 12, built once for every clock that looks the same
+    key = (radius, str(color), font_size_scale)
+    if key not in _faces:
+        face = VGroup(Circle(radius=radius, color=color))
+        inner_circle = Circle(radius=radius * 0.85)
+        for hour in [12, *range(1, 12)]:
+            point_at_angle = inner_circle.point_at_angle(
+                -TAU * ((hour % 12) - 3) / 12
+            )
+            face.add(
+                MathTex(
+                    hour,
+                    font_size=radius * DEFAULT_FONT_SIZE * font_size_scale,
+                ).move_to(point_at_angle)
+            )
+        face.add(Dot(radius=radius * 0.025, color=color))
+        hand = Arrow(
+            start=ORIGIN,
+            end=UP * radius * 0.5,
+            buff=0,
+            max_tip_length_to_length_ratio=0.2,
+        )
+        minute_hand = Arrow(
+            start=ORIGIN,
+            end=UP * radius * 0.75,
+            buff=0,
+            stroke_width=3,
+            max_tip_length_to_length_ratio=0.1,
+        )
+        _faces[key] = (face, hand, minute_hand)
+    return _faces[key]
 
 
 class Clock(VGroup):
@@ -9,39 +68,87 @@ class Clock(VGroup):
         color=WHITE,
         font_size_scale=0.5,
         hour=12,
+        # Adds a minute hand and drives both hands from self.time, in
+        # fractional hours
+        continuous=False,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
         self.hour = hour % 12
-        self.hours: dict[int, MathTex] = {}
-        self.circle = Circle(radius=radius, color=color)
-        self.clock_hand = Arrow(
-            start=self.circle.get_center(),
-            end=self.get_center() + UP * radius * 0.5,
-            buff=0,
-            max_tip_length_to_length_ratio=0.2,
-        ).rotate(
-            -TAU * (hour % 12) / 12, about_point=self.circle.get_center()
+        self.continuous = continuous
+        face, hand, minute_hand = _get_face(radius, color, font_size_scale)
+        face = face.copy()
+        self.circle = face[0]
+        self.hours: dict[int, MathTex] = dict(
+            zip([12, *range(1, 12)], face[1:13])
         )
+        self.clock_hand = hand.copy()
 
-        self.add(self.circle)
+        self.add(*face)
+        self.add(self.clock_hand)
 
-        inner_circle = Circle(*args, radius=radius * 0.85, **kwargs)
-        for hour in [12, *range(1, 12)]:
-            point_at_angle = inner_circle.point_at_angle(
-                -TAU * ((hour % 12) - 3) / 12
+        if continuous:
+            self.minute_hand = minute_hand.copy()
+            self.add(self.minute_hand)
+            # 12 o'clock geometry of each hand, relative to the center and
+            # at the size the clock was built at, with the hours one turn of
+            # the hand takes
+            self.hand_bases = [
+                (member, base.points.copy(), hours_per_turn)
+                for hand_copy, prototype, hours_per_turn in [
+                    (self.clock_hand, hand, 12),
+                    (self.minute_hand, minute_hand, 1),
+                ]
+                for member, base in zip(
+                    hand_copy.get_family(), prototype.get_family()
+                )
+            ]
+            self.base_width = self.circle.width
+            self.time = ValueTracker(hour % 12)
+            self.applied_pose = None
+            self.update_hands()
+            self.add_updater(Clock.update_hands)
+        else:
+            self.clock_hand.rotate(
+                -TAU * (hour % 12) / 12, about_point=self.circle.get_center()
             )
-            hour_text = MathTex(
-                hour,
-                font_size=radius * DEFAULT_FONT_SIZE * font_size_scale,
-            ).move_to(point_at_angle)
-            self.hours[hour] = hour_text
-            self.add(hour_text)
-
-        self.add(Dot(radius=radius * 0.025, color=color))
-        self.add(self.clock_hand)
+
+    def update_hands(self):
+        # Each hand is its 12 o'clock geometry times one of a fixed set of
+        # rotation matrices, scaled and moved to where the clock is now, so
+        # the cost doesn't depend on how many turns have gone by
+        time = self.time.get_value()
+        center = self.circle.get_center()
+        size = self.circle.width / self.base_width
+        steps = {
+            hours_per_turn: round(time / hours_per_turn * _ROTATION_STEPS)
+            % _ROTATION_STEPS
+            for hours_per_turn in (12, 1)
+        }
+        pose = (steps[12], steps[1], *center, size)
+        if pose == self.applied_pose:
+            return self
+        rotations = _get_rotations()
+        for member, base, hours_per_turn in self.hand_bases:
+            if member.points.shape != base.shape:
+                member.points = np.empty_like(base)
+            rotation = rotations[steps[hours_per_turn]]
+            np.matmul(base, rotation.T, out=member.points)
+            member.points *= size
+            member.points += center
+        self.applied_pose = pose
+        return self
+
+    def set_time(self, time: float):
+        self.time.set_value(time)
+        self.hour = time % 12
+        return self.update_hands()
 
     def to_hour(self, hour: int):
+        if self.continuous:
+            # Forward to the next time it's that hour
+            self.set_time(self.time.get_value() + (hour - self.hour) % 12)
+            return
         hour_diff = (hour - self.hour) % 12
         self.clock_hand.rotate(
             -TAU * hour_diff / 12, about_point=self.circle.get_center()
@@ -70,12 +177,28 @@ class ClockToHour(Animation):
             hour_diff = (clock.hour - self.target_hour) % 12
 
         self.angle = direction_mult * TAU * hour_diff / 12
+        # A continuous clock's hands follow its time
         super().__init__(
-            clock.clock_hand, run_time=run_time, rate_func=rate_func, **kwargs
+            clock.time if clock.continuous else clock.clock_hand,
+            run_time=run_time,
+            rate_func=rate_func,
+            **kwargs
         )
 
+    def begin(self):
+        self.starting_state = FamilySnapshot(self.mobject)
+        if self.clock.continuous:
+            self.start_time = self.clock.time.get_value()
+        super().begin()
+
     def interpolate_mobject(self, alpha: float):
-        self.mobject.become(self.starting_mobject)
+        if self.clock.continuous:
+            self.clock.set_time(
+                self.start_time
+                - self.rate_func(alpha) * self.angle * 12 / TAU
+            )
+            return
+        self.starting_state.restore()
         self.mobject.rotate(
             self.rate_func(alpha) * self.angle,
             axis=OUT,
@@ -87,6 +210,81 @@ class ClockToHour(Animation):
         self.clock.hour = self.target_hour
 
 
+class ClocksToHours(Animation):
+    # ClockToHour for many clocks at once: the points of every hand are
+    # stacked and rotated about their clock's center in one pass
+    def __init__(
+        self,
+        clocks,
+        hours,
+        direction="CW",
+        run_time: float = 1,
+        rate_func: Callable[[float], float] = linear,
+        **kwargs
+    ):
+        self.clocks = list(clocks)
+        if isinstance(hours, numbers.Integral):
+            hours = [hours] * len(self.clocks)
+        self.target_hours = [hour % 12 for hour in hours]
+
+        if direction == "CW":
+            hour_diffs = [
+                (target - clock.hour) % 12
+                for clock, target in zip(self.clocks, self.target_hours)
+            ]
+        else:
+            hour_diffs = [
+                (clock.hour - target) % 12
+                for clock, target in zip(self.clocks, self.target_hours)
+            ]
+        direction_mult = -1 if direction == "CW" else 1
+        self.angles = direction_mult * TAU * np.array(hour_diffs) / 12
+        # Animating the clocks' own group keeps the scene from adding a new
+        # one of just the hands, which would stay behind when the clocks are
+        # removed. A plain list gets a group that's taken out again after.
+        self.temporary_group = not isinstance(clocks, Mobject)
+        super().__init__(
+            Group(*self.clocks) if self.temporary_group else clocks,
+            run_time=run_time,
+            rate_func=rate_func,
+            **kwargs
+        )
+
+    def create_starting_mobject(self):
+        # The hands are rotated from their stacked points, not from a copy
+        return self.mobject
+
+    def begin(self):
+        self.stack = StackedPoints(
+            [clock.clock_hand for clock in self.clocks]
+        )
+        about_points = np.array(
+            [clock.clock_hand.get_start() for clock in self.clocks]
+        ).reshape(-1, 3)
+        index = self.stack.item_index
+        self.about_points = about_points[index]
+        self.relative_points = self.stack.points - self.about_points
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float):
+        if not self.clocks:
+            return
+        angles = self.rate_func(alpha) * self.angles[self.stack.item_index]
+        cos, sin = np.cos(angles), np.sin(angles)
+        x, y = self.relative_points[:, 0], self.relative_points[:, 1]
+        points = self.stack.points
+        np.add(cos * x - sin * y, self.about_points[:, 0], out=points[:, 0])
+        np.add(sin * x + cos * y, self.about_points[:, 1], out=points[:, 1])
+
+    def clean_up_from_scene(self, scene):
+        self.stack.release()
+        # Not scene.remove, which would take the clocks out with it
+        if self.temporary_group and self.mobject in scene.mobjects:
+            scene.mobjects.remove(self.mobject)
+        for clock, hour in zip(self.clocks, self.target_hours):
+            clock.hour = hour
+
+
 class ClockTest(Scene):
     def construct(self):
         clock = Clock()
@@ -104,3 +302,27 @@ class ClockTest(Scene):
         self.wait()
         self.play(ClockToHour(clock, 18))
         self.wait()
+
+        self.clear()
+        clocks = VGroup(
+            *[Clock(radius=0.3, hour=i % 12) for i in range(120)]
+        ).arrange_in_grid(rows=8, cols=15)
+        self.add(clocks)
+        self.play(ClocksToHours(clocks, [2 * i for i in range(120)]))
+        self.play(ClocksToHours(clocks, 12, direction="CCW"))
+        self.wait()
+
+        self.clear()
+        clock = Clock(hour=3, continuous=True)
+        self.add(clock)
+        self.wait()
+        self.play(ClockToHour(clock, 5))
+        self.play(
+            clock.time.animate.set_value(5 + 48), run_time=8, rate_func=linear
+        )
+        self.wait()
+        self.play(clock.animate.scale(0.5).to_corner(UL))
+        self.play(
+            clock.time.animate.set_value(5 + 60), run_time=4, rate_func=linear
+        )
+        self.wait()
@@ -1,6 +1,41 @@
 from manim import *
 
 
+class _AlignedRow:
+    # What the layout needs to know about a row, measured once: its height,
+    # the x offset of its anchor from its center, and the center it was last
+    # put at. The first point of its first leaf tells whether the row has
+    # been moved or changed since, in which case it's measured again.
+    def __init__(self, row: Mobject, anchor_key: tuple, anchor_offset: float):
+        self.anchor_key = anchor_key
+        self.anchor_offset = anchor_offset
+        self.height = row.height
+        self.center = row.get_center()
+        self.leaf = next(
+            (member for member in row.get_family() if len(member.points)),
+            None,
+        )
+        self.leaf_point = self._leaf_point()
+
+    def _leaf_point(self):
+        if self.leaf is None or len(self.leaf.points) == 0:
+            return None
+        return self.leaf.points[0].copy()
+
+    def is_stale(self):
+        leaf_point = self._leaf_point()
+        return leaf_point is None or not np.array_equal(
+            leaf_point, self.leaf_point
+        )
+
+    def move_to(self, row: Mobject, center: np.ndarray):
+        shift = center - self.center
+        if np.any(shift):
+            row.shift(shift)
+            self.center = center
+            self.leaf_point = self._leaf_point()
+
+
 class Equations(VGroup):
     def __init__(
         self,
@@ -10,42 +45,79 @@ class Equations(VGroup):
         # { mode: "tex", tex: str, target: int } |
         # { mode: "index", anchor_func: Callable[[int], int], target: int } |
         # { mode: "none" }
+        # anchor_func gives the index of the part of each row to align.
         align_opts={"mode": "tex", "tex": "=", "target": 0},
         **kwargs,
     ):
         self.align_opts = align_opts
         super().__init__(*args, **kwargs)
+        # Measurements of each row, kept across mutations so only new or
+        # changed rows are measured again
+        self.aligned_rows: dict[Mobject, _AlignedRow] = {}
         self._align_eqs()
 
-    def _align_eqs_by_tex(self):
-        if len(self) == 0:
-            return
-
-        target_index = self.align_opts["target"]
-        tex_aligner = self.align_opts["tex"]
-        anchor = self[target_index].get_part_by_tex(tex_aligner).get_x()
-        for i in range(len(self)):
-            if i == target_index:
-                continue
-
-            eq = self[i]
-            eq_anchor = eq.get_part_by_tex(tex_aligner).get_x()
-
-            offset = eq_anchor - anchor
-            eq.shift(LEFT * offset)
-
-
-    def _align_eqs(self):
-        self.arrange(DOWN)
-
+    def _anchor_key(self, index: int) -> tuple:
         mode = self.align_opts["mode"]
         if mode == "tex":
-            self._align_eqs_by_tex()
+            return (mode, self.align_opts["tex"])
+        elif mode == "index":
+            return (mode, self.align_opts["anchor_func"](index))
         elif mode == "none":
-            pass
+            return (mode,)
         else:
             raise NotImplementedError
 
+    def _aligned_row(self, index: int, row: Mobject) -> _AlignedRow:
+        anchor_key = self._anchor_key(index)
+        aligned_row = self.aligned_rows.get(row)
+        if (
+            aligned_row is not None
+            and aligned_row.anchor_key == anchor_key
+            and not aligned_row.is_stale()
+        ):
+            return aligned_row
+
+        mode = anchor_key[0]
+        if mode == "tex":
+            anchor = row.get_part_by_tex(anchor_key[1])
+        elif mode == "index":
+            anchor = row[anchor_key[1]]
+        else:
+            anchor = row
+        return _AlignedRow(row, anchor_key, anchor.get_x() - row.get_x())
+
+    def _align_eqs(self):
+        # Same layout as arrange(DOWN) followed by shifting every row so its
+        # anchor lines up with the target row's, worked out from the cached
+        # measurements. Rows that end up where they were aren't touched.
+        aligned_rows = [
+            self._aligned_row(i, row) for i, row in enumerate(self)
+        ]
+        self.aligned_rows = dict(zip(self.submobjects, aligned_rows))
+        if not aligned_rows:
+            return
+
+        buff = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
+        target_offset = (
+            aligned_rows[self.align_opts["target"]].anchor_offset
+            if self.align_opts["mode"] != "none"
+            else 0
+        )
+        top = (
+            sum(aligned_row.height for aligned_row in aligned_rows)
+            + buff * (len(aligned_rows) - 1)
+        ) / 2
+        for row, aligned_row in zip(self, aligned_rows):
+            center = np.array(
+                [
+                    target_offset - aligned_row.anchor_offset,
+                    top - aligned_row.height / 2,
+                    aligned_row.center[2],
+                ]
+            )
+            aligned_row.move_to(row, center)
+            top -= aligned_row.height + buff
+
     def add_equation(self, equation: MathTex, index=None):
         index = index if index is not None else len(self)
         self.insert(index, equation)
@@ -110,3 +182,17 @@ class EquationsTest(Scene):
             )
         )
         self.wait()
+        self.play(eqs.animate.remove_equation_by_index(0))
+        self.wait()
+
+        indexed = Equations(
+            MathTex("x", "+", "1", "=", "2"),
+            MathTex("x", "=", "1"),
+            align_opts={
+                "mode": "index",
+                "anchor_func": lambda i: 3 if i == 0 else 1,
+                "target": 0,
+            },
+        ).to_edge(DOWN)
+        self.add(indexed)
+        self.wait()
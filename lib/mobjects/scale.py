@@ -1,4 +1,5 @@
 from manim import *
+from typing import Optional
 from lib.misc.compose_animations import ComposeAnimations
 
 
@@ -71,37 +72,29 @@ class Scale(Group):
         left_ropes = Group(left_rope1, left_rope2)
         right_ropes = Group(right_rope1, right_rope2)
 
-        left_ropes.add_updater(
-            lambda z: z.move_to(lever_arm.get_start()).align_to(
-                lever_arm.get_start(), UP
-            )
-        )
-        right_ropes.add_updater(
-            lambda z: z.move_to(lever_arm.get_end()).align_to(
-                lever_arm.get_end(), UP
-            )
-        )
-
-        left_base.add_updater(
-            lambda z: z.move_to(lever_arm.get_start()).shift(
-                DOWN * column_height * rope_height_ratio
-            )
-        )
-        right_base.add_updater(
-            lambda z: z.move_to(lever_arm.get_end()).shift(
-                DOWN * column_height * rope_height_ratio
-            )
-        )
-
         left_mobject.next_to(left_base, UP)
         right_mobject.next_to(right_base, UP)
 
-        left_mobject.add_updater(lambda z: z.next_to(left_base, UP))
-        right_mobject.add_updater(lambda z: z.next_to(right_base, UP))
-
+        self.base = base
         self.lever_arm = lever_arm
         self.pivot = pivot
 
+        # Everything below the arm hangs from one of its ends, and only ever
+        # moves with it
+        self.left_side = [left_ropes, left_base, left_mobject]
+        self.right_side = [right_ropes, right_base, right_mobject]
+        # Level pose, relative to the pivot, at the size the scale was built
+        # at. The base never moves with the arm, so its width tells how much
+        # the scale has been resized since.
+        self.rest_lever_points = lever_arm.points - pivot_point
+        self.rest_arm_ends = np.array([left_point, right_point]) - pivot_point
+        self.base_width = base.width
+        # Angle of the arm, counterclockwise, and how far the pose has been
+        # moved to follow it, at the built size
+        self.tilt = ValueTracker(0)
+        self.applied_tilt = 0
+        self.applied_offsets = np.zeros((2, 3))
+
         self.add(
             base,
             base_close,
@@ -117,29 +110,122 @@ class Scale(Group):
             right_mobject,
         )
         self.center()
+        self.add_updater(Scale.update_rig)
+
+    def set_tilt(self, tilt: float):
+        self.tilt.set_value(tilt)
+        return self.update_rig()
+
+    def update_rig(self):
+        # Poses the scale for the current tilt: the arm is the level arm
+        # rotated about the pivot, and each side is translated by how far
+        # its end of the arm moved. Resizing the scale resizes the pose it
+        # already has, so the rest pose and offsets are scaled to match.
+        tilt = self.tilt.get_value()
+        if tilt == self.applied_tilt:
+            return self
+        size = self.base.width / self.base_width
+        rotation = rotation_matrix(tilt, OUT)
+        pivot_point = self.pivot.get_center()
+        points = self.lever_arm.points
+        np.matmul(self.rest_lever_points, rotation.T, out=points)
+        points *= size
+        points += pivot_point
+
+        offsets = self.rest_arm_ends @ rotation.T - self.rest_arm_ends
+        for side, offset, applied in zip(
+            (self.left_side, self.right_side), offsets, self.applied_offsets
+        ):
+            for mobject in side:
+                mobject.shift((offset - applied) * size)
+        self.applied_offsets = offsets
+        self.applied_tilt = tilt
+        return self
 
 
 class WeighScale(ComposeAnimations):
-    def __init__(self, scale: Scale, *args, angle: float = PI/12, run_time=4, **kwargs):
-        super().__init__(scale.lever_arm, *args, run_time=run_time, **kwargs)
+    def __init__(
+        self,
+        scale: Scale,
+        *args,
+        angle: float = PI / 12,
+        run_time=4,
+        # If given, the scale settles at a tilt of imbalance * angle with a
+        # damped oscillation instead of swinging both ways and back. Positive
+        # means the left side is heavier.
+        imbalance: Optional[float] = None,
+        # Oscillations per second and damping ratio of the settling
+        frequency: float = 1,
+        damping_ratio: float = 0.2,
+        **kwargs,
+    ):
+        super().__init__(
+            scale.tilt,
+            *args,
+            run_time=run_time,
+            skip_finished_directives=True,
+            **kwargs,
+        )
         self.scale = scale
         self.angle = angle
-        self.add_directives(
-            (0.5, WeighScale.rotate1), (0.5, WeighScale.rotate2)
+        self.imbalance = imbalance
+        self.frequency = frequency
+        self.damping_ratio = damping_ratio
+        if imbalance is None:
+            self.add_directives(
+                (0.5, WeighScale.rotate1), (0.5, WeighScale.rotate2)
+            )
+        else:
+            self.add_directives((1, WeighScale.settle))
+
+    @staticmethod
+    def step_response(
+        duration, frequency, damping_ratio, samples_per_second=240
+    ):
+        # How far a damped oscillator starting at rest has gone towards its
+        # target over the duration, with semi-implicit Euler steps
+        count = max(int(duration * samples_per_second), 1) + 1
+        dt = duration / (count - 1)
+        omega = TAU * frequency
+        response = np.empty(count)
+        position = velocity = 0.0
+        for i in range(count):
+            response[i] = position
+            acceleration = (
+                omega**2 * (1 - position)
+                - 2 * damping_ratio * omega * velocity
+            )
+            velocity += acceleration * dt
+            position += velocity * dt
+        return response
+
+    def begin(self):
+        self.base_tilt = self.scale.tilt.get_value()
+        if self.imbalance is not None:
+            # The whole trajectory is integrated before the first frame, so
+            # frames only look it up. It's done here rather than in __init__
+            # so it lasts the run_time the animation is played with.
+            self.settle_response = self.step_response(
+                self.run_time, self.frequency, self.damping_ratio
+            )
+            self.settle_alphas = np.linspace(0, 1, len(self.settle_response))
+        super().begin()
+
+    def settle(self, alpha: float):
+        progress = np.interp(alpha, self.settle_alphas, self.settle_response)
+        target_tilt = self.imbalance * self.angle
+        self.scale.set_tilt(
+            self.base_tilt + (target_tilt - self.base_tilt) * progress
         )
 
     def rotate1(self, alpha: float):
-        self.mobject.become(self.starting_mobject)
-        self.mobject.rotate(
-            there_and_back(alpha) * self.angle,
-            about_point=self.scale.pivot.get_center(),
+        self.scale.set_tilt(
+            self.base_tilt + there_and_back(alpha) * self.angle
         )
 
     def rotate2(self, alpha: float):
-        self.mobject.become(self.starting_mobject)
-        self.mobject.rotate(
-            -there_and_back(alpha) * self.angle,
-            about_point=self.scale.pivot.get_center(),
+        self.scale.set_tilt(
+            self.base_tilt - there_and_back(alpha) * self.angle
         )
 
 
@@ -154,3 +240,13 @@ class ScaleTest(Scene):
         self.play(WeighScale(scale, angle=PI / 12))
         self.play(WeighScale(scale, angle=PI / 12))
         self.play(WeighScale(scale, angle=PI / 12))
+        self.play(scale.tilt.animate.set_value(PI / 24))
+        self.play(WeighScale(scale, angle=PI / 24))
+        self.play(scale.tilt.animate.set_value(0))
+        self.play(WeighScale(scale, imbalance=1, run_time=8))
+        self.play(WeighScale(scale, imbalance=-0.5, run_time=20))
+        # A run_time given to play works like one given to WeighScale
+        self.play(WeighScale(scale, imbalance=0), run_time=8)
+        # The rig follows the scale's size
+        self.play(scale.animate.scale(0.5))
+        self.play(WeighScale(scale, angle=PI / 12))
@@ -1,5 +1,12 @@
 from manim import *
-from lib.mobjects.bucket import Bucket, PutInBucket, TakeOutBucket
+from lib.mobjects.bucket import (
+    Bucket,
+    PutInBucket,
+    TakeOutBucket,
+    BatchPutInBucket,
+    BatchTakeOutBucket,
+    RelabelBucket,
+)
 from lib.mobjects.scale import Scale, WeighScale
 from lib.mobjects.equations import Equations
 from lib.mobjects.calculator import Calculator
@@ -64,7 +71,8 @@ class Intro(Scene):
 
         # But you might reason that 0.9 is pretty close to 1
         sequence_line = SequenceLine(
-            sequence=lambda n: (10**n - 1) / 10**n,
+            sequence=None,
+            vectorized_sequence=lambda n: 1 - 10.0**-n,
             converge_value=1,
             sequence_str=lambda n: "0." + ("9" * n),
             samples=100,
@@ -317,19 +325,13 @@ class Chapter1(Scene):
         self.play(TransformMatchingTex(eq2, eq3))
         self.wait()
 
-        calculator = Calculator().center()
-        eq_on_screen1 = MathTex(r"3\div 3")
-        eq_on_screen2 = MathTex(r"1")
-        calculator.move_obj_to_screen(eq_on_screen1)
+        calculator = Calculator().center().type_sequence("3÷3")
         self.play(
             FadeOut(eq3, shift=DOWN),
-            FadeIn(Group(calculator, eq_on_screen1), shift=DOWN),
+            FadeIn(calculator, shift=DOWN),
         )
         self.wait()
-        self.play(calculator.animate.tap_button("="))
-        calculator.move_obj_to_screen(eq_on_screen2)
-        self.add(eq_on_screen2)
-        self.remove(eq_on_screen1)
+        self.play(calculator.animate.type_sequence("="))
         self.wait()
 
         # The fraction 2/2 is two whole numbers separated by a line
@@ -442,12 +444,8 @@ class Chapter1(Scene):
         )
         self.play(FadeIn(more_items, shift=DOWN))
         self.play(
-            LaggedStart(
-                *[
-                    PutInBucket(item, bucket1, move_above_weight=-1)
-                    for item in more_items
-                ],
-                lag_ratio=0.25,
+            BatchPutInBucket(
+                more_items, bucket1, move_above_weight=-1, lag_ratio=0.25
             ),
             run_time=4,
         )
@@ -480,12 +478,8 @@ class Chapter1(Scene):
         )
         self.play(FadeIn(more_items.next_to(bucket2, UP), shift=DOWN))
         self.play(
-            LaggedStart(
-                *[
-                    PutInBucket(item, bucket2, move_above_weight=-1)
-                    for item in more_items
-                ],
-                lag_ratio=0.25,
+            BatchPutInBucket(
+                more_items, bucket2, move_above_weight=-1, lag_ratio=0.25
             ),
             run_time=4,
         )
@@ -506,19 +500,14 @@ class Chapter1(Scene):
             .next_to(bucket2, UP)
         )
         self.play(
-            LaggedStart(
-                *[
-                    TakeOutBucket(item, bucket2, move_above=False)
-                    for item in relabel_items
-                ],
-                lag_ratio=0.02,
+            BatchTakeOutBucket(
+                relabel_items, bucket2, move_above=False, lag_ratio=0.02
             )
         )
         self.wait()
         for item in relabel_items[:-1]:
-            target = bucket2.generate_target()
-            target.relabel(item.tex_string)
-            self.play(item.animate.become(target.label), MoveToTarget(bucket2))
+            relabel = RelabelBucket(bucket2, item.tex_string)
+            self.play(item.animate.become(relabel.new_label), relabel)
             self.remove(item)
 
         self.wait()
@@ -711,10 +700,10 @@ class Chapter1(Scene):
         self.play(ReplacementTransform(add_labels_eqs[1], add_labels_eqs[2]))
         self.wait()
 
-        target = bucket3.generate_target().relabel(r"\frac{8}{12}")
+        relabel = RelabelBucket(bucket3, r"\frac{8}{12}")
         self.play(
-            add_labels_eqs[-1].animate.become(target.label),
-            MoveToTarget(bucket3),
+            add_labels_eqs[-1].animate.become(relabel.new_label),
+            relabel,
         )
         self.remove(*add_labels_eqs)
         self.wait()
@@ -766,21 +755,19 @@ class Chapter1(Scene):
         )
         self.wait()
 
-        target1, target2, target3 = (
-            bucket1.generate_target(),
-            bucket2.generate_target(),
-            bucket3.generate_target(),
-        )
-        target1.label.set_opacity(1)
-        target2.label.set_opacity(1)
-        target3.label.set_opacity(1)
         self.play(
-            MoveToTarget(bucket1),
-            MoveToTarget(bucket2),
-            MoveToTarget(bucket3),
-            bucket_labels1_copy[0].animate.become(target1.label),
-            bucket_labels2_copy[0].animate.become(target2.label),
-            bucket_labels3_copy[0].animate.become(target3.label),
+            bucket1.label.animate.set_opacity(1),
+            bucket2.label.animate.set_opacity(1),
+            bucket3.label.animate.set_opacity(1),
+            bucket_labels1_copy[0].animate.become(
+                bucket1.label.copy().set_opacity(1)
+            ),
+            bucket_labels2_copy[0].animate.become(
+                bucket2.label.copy().set_opacity(1)
+            ),
+            bucket_labels3_copy[0].animate.become(
+                bucket3.label.copy().set_opacity(1)
+            ),
         )
         self.remove(
             bucket_labels1_copy[0],
@@ -788,11 +775,10 @@ class Chapter1(Scene):
             bucket_labels3_copy[0],
         )
         self.wait()
-        target = bucket1.generate_target()
-        target.relabel(r"\frac{2}{4}")
+        relabel = RelabelBucket(bucket1, r"\frac{2}{4}")
         self.play(
-            MoveToTarget(bucket1),
-            bucket_labels1_copy[1].animate.become(target.label),
+            relabel,
+            bucket_labels1_copy[1].animate.become(relabel.new_label),
         )
         self.remove(bucket_labels1_copy[1])
         self.wait()
@@ -824,9 +810,8 @@ class Chapter1(Scene):
         self.play(add_labels_eqs[-1].animate.become(label_copy))
         self.remove(add_labels_eqs[-1])
         self.wait()
-        target = bucket3.generate_target()
-        target.relabel(r"\frac{16}{24}")
-        self.play(MoveToTarget(bucket3), label_copy.animate.become(target.label))
+        relabel = RelabelBucket(bucket3, r"\frac{16}{24}")
+        self.play(relabel, label_copy.animate.become(relabel.new_label))
         self.remove(label_copy)
 
         self.clear()